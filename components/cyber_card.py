@@ -21,14 +21,7 @@ class CyberCard(QWidget):
         
     def setup_ui(self, title: str):
         """Setup card UI structure."""
-        self.setStyleSheet(f"""
-            CyberCard {{
-                background-color: {config.COLOR_CARD};
-                border: 1px solid {config.COLOR_BORDER};
-                border-radius: 8px;
-            }}
-        """)
-        
+        # Card and title styling come from the CyberCard rules in assets/theme.qss
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(
             config.SPACING_MD, 
@@ -40,12 +33,7 @@ class CyberCard(QWidget):
         
         if title:
             title_label = QLabel(title)
-            title_label.setStyleSheet(f"""
-                color: {config.COLOR_PRIMARY};
-                font-family: {config.FONT_FAMILY};
-                font-size: {config.FONT_SIZE_HEADER}pt;
-                font-weight: bold;
-            """)
+            title_label.setProperty("role", "cardTitle")
             main_layout.addWidget(title_label)
         
         self.content_layout.setSpacing(config.SPACING_SM)
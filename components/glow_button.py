@@ -5,6 +5,39 @@ from PySide6.QtGui import QColor
 import config
 
 
+def _button_qss(color: str) -> str:
+    """Build the button stylesheet for one neon colour."""
+    return f"""
+        QPushButton {{
+            background-color: {config.COLOR_CARD};
+            color: {color};
+            border: 2px solid {color};
+            border-radius: 4px;
+            padding: {config.SPACING_SM}px {config.SPACING_MD}px;
+            font-family: {config.FONT_FAMILY};
+            font-size: {config.FONT_SIZE_NORMAL}pt;
+            font-weight: bold;
+        }}
+        QPushButton:hover {{
+            background-color: {color}22;
+        }}
+        QPushButton:pressed {{
+            background-color: {color}44;
+        }}
+        QPushButton:disabled {{
+            color: #555;
+            border-color: #555;
+        }}
+    """
+
+
+# Stylesheets for primary (True) and accent (False) buttons, formatted once at import
+_BUTTON_QSS = {
+    True: _button_qss(config.COLOR_PRIMARY),
+    False: _button_qss(config.COLOR_ACCENT)
+}
+
+
 class GlowButton(QPushButton):
     """Cyberpunk-style button with neon glow effect."""
     
@@ -24,29 +57,7 @@ class GlowButton(QPushButton):
         
     def setup_style(self):
         """Apply button styling."""
-        color = config.COLOR_PRIMARY if self.primary else config.COLOR_ACCENT
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {config.COLOR_CARD};
-                color: {color};
-                border: 2px solid {color};
-                border-radius: 4px;
-                padding: {config.SPACING_SM}px {config.SPACING_MD}px;
-                font-family: {config.FONT_FAMILY};
-                font-size: {config.FONT_SIZE_NORMAL}pt;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {color}22;
-            }}
-            QPushButton:pressed {{
-                background-color: {color}44;
-            }}
-            QPushButton:disabled {{
-                color: #555;
-                border-color: #555;
-            }}
-        """)
+        self.setStyleSheet(_BUTTON_QSS[bool(self.primary)])
         self.setCursor(Qt.PointingHandCursor)
         
     def _get_glow_intensity(self) -> int:
@@ -67,7 +67,9 @@ class MetricCard(QWidget):
     def update_value(self, value: str, color: str = None):
         """Update metric value and color."""
         self.value_label.setText(value)
-        if color:
+        # Restyle only when the colour actually changes; the label is held
+        # directly so no child lookup is needed either way.
+        if color and color != self.border_color:
             self.border_color = color
             self.value_label.setStyleSheet(f"""
                 color: {color};
@@ -1,9 +1,35 @@
 """Reusable status badge component."""
-from PySide6.QtWidgets import QLabel
-from PySide6.QtCore import Qt
+from functools import lru_cache
+from PySide6.QtWidgets import QLabel, QWidget
+from PySide6.QtGui import QPixmap
+from PySide6.QtCore import Qt, QPoint
 import config
 
 
+def _badge_qss(color: str) -> str:
+    """Build the badge stylesheet for one status colour."""
+    return f"""
+        background-color: {color}22;
+        color: {color};
+        border: 1px solid {color};
+        border-radius: 4px;
+        padding: {config.SPACING_XS}px {config.SPACING_SM}px;
+        font-family: {config.FONT_FAMILY};
+        font-size: 9pt;
+        font-weight: bold;
+    """
+
+
+# Badge stylesheets, formatted once per status type at import
+_BADGE_QSS = {
+    "critical": _badge_qss(config.COLOR_CRITICAL),
+    "warning": _badge_qss(config.COLOR_WARNING),
+    "info": _badge_qss(config.COLOR_PRIMARY),
+    "secure": _badge_qss(config.COLOR_PRIMARY)
+}
+_DEFAULT_BADGE_QSS = _badge_qss(config.COLOR_TEXT)
+
+
 class StatusBadge(QLabel):
     """Small colored status badge."""
     
@@ -21,23 +47,25 @@ class StatusBadge(QLabel):
         
     def setup_style(self, status_type: str):
         """Apply badge styling based on status type."""
-        color_map = {
-            "critical": config.COLOR_CRITICAL,
-            "warning": config.COLOR_WARNING,
-            "info": config.COLOR_PRIMARY,
-            "secure": config.COLOR_PRIMARY
-        }
-        
-        color = color_map.get(status_type.lower(), config.COLOR_TEXT)
-        
-        self.setStyleSheet(f"""
-            background-color: {color}22;
-            color: {color};
-            border: 1px solid {color};
-            border-radius: 4px;
-            padding: {config.SPACING_XS}px {config.SPACING_SM}px;
-            font-family: {config.FONT_FAMILY};
-            font-size: 9pt;
-            font-weight: bold;
-        """)
+        self.setStyleSheet(_BADGE_QSS.get(status_type.lower(), _DEFAULT_BADGE_QSS))
         self.setAlignment(Qt.AlignCenter)
+
+
+@lru_cache(maxsize=64)
+def badge_pixmap(text: str, status_type: str = "info") -> QPixmap:
+    """
+    Render a badge once and return the cached pixmap.
+    
+    Findings repeat a handful of severity/cloud pairs, so labels showing
+    this pixmap avoid a styled widget per badge.
+    """
+    badge = StatusBadge(text, status_type)
+    badge.adjustSize()
+    ratio = badge.devicePixelRatioF()
+    pixmap = QPixmap(badge.size() * ratio)
+    pixmap.setDevicePixelRatio(ratio)
+    # Leave the rounded corners transparent; grab() would fill them
+    # with the window background of the unparented badge.
+    pixmap.fill(Qt.transparent)
+    badge.render(pixmap, QPoint(), renderFlags=QWidget.DrawChildren)
+    return pixmap
@@ -28,3 +28,6 @@ SIDEBAR_WIDTH = 200
 INPUT_LABEL_WIDTH = 150
 WINDOW_MIN_WIDTH = 1200
 WINDOW_MIN_HEIGHT = 700
+
+# Scan
+DEMO_MODE = False  # pace the scan narration with artificial delays for demos
@@ -1,6 +1,7 @@
 """Real cloud scanner orchestrator for CloudStrike Phase-2."""
 import logging
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, List, Dict, Optional
 from cloud.aws_scanner import AWSScanner
 from cloud.azure_scanner import AzureScanner
 from cloud.gcp_scanner import GCPScanner
@@ -12,7 +13,75 @@ from core.ai_engine import ai_analyzer
 logger = logging.getLogger(__name__)
 
 
-def run_cloud_scan(credentials: Dict[str, Dict[str, str]]) -> Dict[str, any]:
+def scan_aws(creds: Dict[str, str]) -> List[Dict]:
+    """Run the AWS checks; raises if the scan cannot complete."""
+    logger.info("Scanning AWS...")
+    aws_scanner = AWSScanner(
+        access_key=creds['access_key'],
+        secret_key=creds['secret_key'],
+        region=creds.get('region', 'us-east-1')
+    )
+    return aws_scanner.run_checks()
+
+
+def scan_azure(creds: Dict[str, str]) -> List[Dict]:
+    """Run the Azure checks; raises if the scan cannot complete."""
+    logger.info("Scanning Azure...")
+    azure_scanner = AzureScanner(
+        tenant_id=creds['tenant_id'],
+        client_id=creds['client_id'],
+        client_secret=creds['client_secret']
+    )
+    return azure_scanner.run_checks()
+
+
+def scan_gcp(creds: Dict[str, str]) -> List[Dict]:
+    """Run the GCP checks; raises if the scan cannot complete."""
+    logger.info("Scanning GCP...")
+    gcp_scanner = GCPScanner(
+        project_id=creds['project_id'],
+        service_account_path=creds['service_account_path']
+    )
+    return gcp_scanner.run_checks()
+
+
+# (name, credentials key, required credential fields, scan function,
+#  remediation hint for a failed scan), in the order results are reported
+_PROVIDERS = (
+    ("AWS", "aws", ("access_key", "secret_key"), scan_aws,
+     "Check AWS credentials and permissions."),
+    ("Azure", "azure", ("tenant_id", "client_id", "client_secret"), scan_azure,
+     "Check Azure credentials and permissions."),
+    ("GCP", "gcp", ("project_id", "service_account_path"), scan_gcp,
+     "Check GCP credentials and service account permissions."),
+)
+
+
+def no_credentials_result() -> Dict[str, any]:
+    """Scan result reported when no cloud provider could be scanned."""
+    return {
+        "findings": [{
+            "title": "No Credentials Configured",
+            "severity": "Info",
+            "cloud": "System",
+            "description": "No cloud provider credentials have been configured. Please add credentials in the Credentials page.",
+            "remediation": "Navigate to Credentials page and configure at least one cloud provider."
+        }],
+        "attacks": [],
+        "risk": {
+            "security_score": 100,
+            "risk_level": "Low",
+            "top_risks": [],
+            "summary": "No cloud credentials configured. Add credentials to begin security assessment."
+        },
+        "remediation": []
+    }
+
+
+def run_cloud_scan(
+    credentials: Dict[str, Dict[str, str]],
+    on_finding: Optional[Callable[[Dict], None]] = None
+) -> Dict[str, any]:
     """
     Run real cloud security scan across all configured providers.
     
@@ -23,6 +92,8 @@ def run_cloud_scan(credentials: Dict[str, Dict[str, str]]) -> Dict[str, any]:
                 'azure': {'tenant_id': '...', 'client_id': '...', 'client_secret': '...'},
                 'gcp': {'project_id': '...', 'service_account_path': '...'}
             }
+        on_finding: Optional callback, called with each finding as soon as
+            its provider has been scanned
     
     Returns:
         Dictionary with findings, attacks, risk analysis, and remediation scripts:
@@ -37,93 +108,46 @@ def run_cloud_scan(credentials: Dict[str, Dict[str, str]]) -> Dict[str, any]:
     all_findings = []
     scanned_clouds = []
     
-    aws_creds = credentials.get('aws', {})
-    if aws_creds.get('access_key') and aws_creds.get('secret_key'):
-        logger.info("Scanning AWS...")
-        try:
-            aws_scanner = AWSScanner(
-                access_key=aws_creds['access_key'],
-                secret_key=aws_creds['secret_key'],
-                region=aws_creds.get('region', 'us-east-1')
-            )
-            aws_findings = aws_scanner.run_checks()
-            all_findings.extend(aws_findings)
-            scanned_clouds.append('AWS')
-            logger.info(f"AWS scan complete: {len(aws_findings)} findings")
-        except Exception as e:
-            logger.error(f"AWS scan failed: {e}")
-            all_findings.append({
-                "title": "AWS Scan Error",
-                "severity": "Warning",
-                "cloud": "AWS",
-                "description": f"Failed to complete AWS scan: {str(e)}",
-                "remediation": "Check AWS credentials and permissions."
-            })
-    
-    azure_creds = credentials.get('azure', {})
-    if azure_creds.get('tenant_id') and azure_creds.get('client_id') and azure_creds.get('client_secret'):
-        logger.info("Scanning Azure...")
-        try:
-            azure_scanner = AzureScanner(
-                tenant_id=azure_creds['tenant_id'],
-                client_id=azure_creds['client_id'],
-                client_secret=azure_creds['client_secret']
-            )
-            azure_findings = azure_scanner.run_checks()
-            all_findings.extend(azure_findings)
-            scanned_clouds.append('Azure')
-            logger.info(f"Azure scan complete: {len(azure_findings)} findings")
-        except Exception as e:
-            logger.error(f"Azure scan failed: {e}")
-            all_findings.append({
-                "title": "Azure Scan Error",
-                "severity": "Warning",
-                "cloud": "Azure",
-                "description": f"Failed to complete Azure scan: {str(e)}",
-                "remediation": "Check Azure credentials and permissions."
-            })
+    # Providers are independent network workloads, so scan them concurrently
+    # and stream each provider's findings as soon as it is done
+    active = [
+        (name, key, scan, hint) for name, key, fields, scan, hint in _PROVIDERS
+        if all(credentials.get(key, {}).get(field) for field in fields)
+    ]
+    provider_findings = {}
+    if active:
+        with ThreadPoolExecutor(max_workers=len(active)) as executor:
+            futures = {
+                executor.submit(scan, credentials[key]): (name, hint)
+                for name, key, scan, hint in active
+            }
+            for future in as_completed(futures):
+                name, hint = futures[future]
+                try:
+                    findings = future.result()
+                    scanned_clouds.append(name)
+                    logger.info(f"{name} scan complete: {len(findings)} findings")
+                except Exception as e:
+                    logger.error(f"{name} scan failed: {e}")
+                    findings = [{
+                        "title": f"{name} Scan Error",
+                        "severity": "Warning",
+                        "cloud": name,
+                        "description": f"Failed to complete {name} scan: {str(e)}",
+                        "remediation": hint
+                    }]
+                provider_findings[name] = findings
+                if on_finding:
+                    for finding in findings:
+                        on_finding(finding)
     
-    gcp_creds = credentials.get('gcp', {})
-    if gcp_creds.get('project_id') and gcp_creds.get('service_account_path'):
-        logger.info("Scanning GCP...")
-        try:
-            gcp_scanner = GCPScanner(
-                project_id=gcp_creds['project_id'],
-                service_account_path=gcp_creds['service_account_path']
-            )
-            gcp_findings = gcp_scanner.run_checks()
-            all_findings.extend(gcp_findings)
-            scanned_clouds.append('GCP')
-            logger.info(f"GCP scan complete: {len(gcp_findings)} findings")
-        except Exception as e:
-            logger.error(f"GCP scan failed: {e}")
-            all_findings.append({
-                "title": "GCP Scan Error",
-                "severity": "Warning",
-                "cloud": "GCP",
-                "description": f"Failed to complete GCP scan: {str(e)}",
-                "remediation": "Check GCP credentials and service account permissions."
-            })
+    # Keep the provider order of a sequential scan in the final result
+    for name, *_ in active:
+        all_findings.extend(provider_findings[name])
     
     if not scanned_clouds:
         logger.warning("No cloud credentials configured")
-        return {
-            "findings": [{
-                "title": "No Credentials Configured",
-                "severity": "Info",
-                "cloud": "System",
-                "description": "No cloud provider credentials have been configured. Please add credentials in the Credentials page.",
-                "remediation": "Navigate to Credentials page and configure at least one cloud provider."
-            }],
-            "attacks": [],
-            "risk": {
-                "security_score": 100,
-                "risk_level": "Low",
-                "top_risks": [],
-                "summary": "No cloud credentials configured. Add credentials to begin security assessment."
-            },
-            "remediation": []
-        }
+        return no_credentials_result()
     
     logger.info(f"Scan complete. Scanned {len(scanned_clouds)} clouds, found {len(all_findings)} total findings.")
     
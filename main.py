@@ -26,12 +26,15 @@ def main():
     app.setApplicationName("CloudStrike")
     app.setOrganizationName("CloudStrike Security")
     
-    # Load global stylesheet
-    try:
-        with open('assets/theme.qss', 'r') as f:
-            app.setStyleSheet(f.read())
-    except Exception as e:
-        logger.warning(f"Could not load theme.qss: {e}")
+    # Load global stylesheets (theme first, page-specific rules after)
+    stylesheet = []
+    for qss_name in ('theme.qss', 'report.qss', 'attack.qss'):
+        try:
+            with open(f'assets/{qss_name}', 'r') as f:
+                stylesheet.append(f.read())
+        except Exception as e:
+            logger.warning(f"Could not load {qss_name}: {e}")
+    app.setStyleSheet("\n".join(stylesheet))
     
     window = MainWindow()
     window.show()
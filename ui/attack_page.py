@@ -4,7 +4,7 @@ from PySide6.QtCore import Qt
 import config
 from components.section_header import SectionHeader
 from components.cyber_card import CyberCard
-from components.status_badge import StatusBadge
+from components.status_badge import badge_pixmap
 from components.glow_button import GlowButton
 
 
@@ -37,30 +37,11 @@ class AttackPage(QWidget):
         # Scroll area for attacks
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: transparent;
-            }
-        """)
-        
-        self.attacks_container = QWidget()
-        self.attacks_layout = QVBoxLayout(self.attacks_container)
-        self.attacks_layout.setSpacing(config.SPACING_LG)
-        self.attacks_layout.setContentsMargins(0, 0, 0, 0)
+        scroll.setObjectName("attackScroll")
         
-        self.empty_label = QLabel("No attack simulations yet. Run a scan to generate attack paths.")
-        self.empty_label.setStyleSheet(f"""
-            color: {config.COLOR_TEXT}88;
-            font-family: {config.FONT_FAMILY};
-            font-size: {config.FONT_SIZE_NORMAL}pt;
-            font-style: italic;
-        """)
-        self.empty_label.setAlignment(Qt.AlignCenter)
-        self.attacks_layout.addWidget(self.empty_label)
-        
-        self.attacks_layout.addStretch()
+        self.scroll = scroll
         
+        self.attacks_container = self.create_attacks_container()
         scroll.setWidget(self.attacks_container)
         layout.addWidget(scroll)
     
@@ -68,35 +49,31 @@ class AttackPage(QWidget):
         """Update attack simulations display."""
         self.attacks = attacks
         
-        # Clear existing widgets
-        while self.attacks_layout.count() > 0:
-            item = self.attacks_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        # Build the new content off-screen, then swap containers so the old
+        # one takes all of its cards with it in a single deleteLater
+        container = self.create_attacks_container()
+        old_container = self.scroll.takeWidget()
+        self.attacks_container = container
+        self.scroll.setWidget(container)
+        old_container.deleteLater()
+    
+    def create_attacks_container(self) -> QWidget:
+        """Create the scroll content for the current attacks."""
+        container = QWidget()
+        self.attacks_layout = QVBoxLayout(container)
+        self.attacks_layout.setSpacing(config.SPACING_LG)
+        self.attacks_layout.setContentsMargins(0, 0, 0, 0)
         
         if not self.attacks:
             self.empty_label = QLabel("No attack simulations yet. Run a scan to generate attack paths.")
-            self.empty_label.setStyleSheet(f"""
-                color: {config.COLOR_TEXT}88;
-                font-family: {config.FONT_FAMILY};
-                font-size: {config.FONT_SIZE_NORMAL}pt;
-                font-style: italic;
-            """)
+            self.empty_label.setProperty("role", "attackEmpty")
             self.empty_label.setAlignment(Qt.AlignCenter)
             self.attacks_layout.addWidget(self.empty_label)
         else:
             # Add summary
             summary_label = QLabel(f"Generated {len(self.attacks)} potential attack paths based on discovered vulnerabilities.")
             summary_label.setWordWrap(True)
-            summary_label.setStyleSheet(f"""
-                color: {config.COLOR_TEXT};
-                font-family: {config.FONT_FAMILY};
-                font-size: {config.FONT_SIZE_NORMAL}pt;
-                padding: {config.SPACING_MD}px;
-                background-color: {config.COLOR_CARD};
-                border-left: 3px solid {config.COLOR_ACCENT};
-                border-radius: 4px;
-            """)
+            summary_label.setProperty("role", "attackSummary")
             self.attacks_layout.addWidget(summary_label)
             
             # Add attack cards
@@ -105,6 +82,7 @@ class AttackPage(QWidget):
                 self.attacks_layout.addWidget(card)
         
         self.attacks_layout.addStretch()
+        return container
     
     def create_attack_card(self, attack: dict) -> CyberCard:
         """Create an attack simulation card."""
@@ -115,20 +93,17 @@ class AttackPage(QWidget):
         
         # Title
         title_label = QLabel(attack["title"])
-        title_label.setStyleSheet(f"""
-            color: {config.COLOR_ACCENT};
-            font-family: {config.FONT_FAMILY};
-            font-size: {config.FONT_SIZE_HEADER}pt;
-            font-weight: bold;
-        """)
+        title_label.setProperty("role", "simTitle")
         content_layout.addWidget(title_label)
         
         # Badges
         badges_layout = QHBoxLayout()
         badges_layout.setSpacing(config.SPACING_SM)
         
-        severity_badge = StatusBadge(attack["severity"], attack["severity"].lower())
-        cloud_badge = StatusBadge(attack["cloud"], "info")
+        severity_badge = QLabel()
+        severity_badge.setPixmap(badge_pixmap(attack["severity"], attack["severity"].lower()))
+        cloud_badge = QLabel()
+        cloud_badge.setPixmap(badge_pixmap(attack["cloud"], "info"))
         
         badges_layout.addWidget(severity_badge)
         badges_layout.addWidget(cloud_badge)
@@ -137,41 +112,22 @@ class AttackPage(QWidget):
         content_layout.addLayout(badges_layout)
         
         # Attack chain steps
+        content_layout.addSpacing(config.SPACING_MD)
         steps_label = QLabel("🎯 Attack Chain:")
-        steps_label.setStyleSheet(f"""
-            color: {config.COLOR_TEXT};
-            font-family: {config.FONT_FAMILY};
-            font-size: {config.FONT_SIZE_NORMAL}pt;
-            font-weight: bold;
-            margin-top: {config.SPACING_MD}px;
-        """)
+        steps_label.setProperty("role", "chainHeader")
         content_layout.addWidget(steps_label)
         
         for idx, step in enumerate(attack.get("steps", []), 1):
             step_label = QLabel(f"{idx}. {step}")
             step_label.setWordWrap(True)
-            step_label.setStyleSheet(f"""
-                color: {config.COLOR_TEXT}cc;
-                font-family: {config.FONT_FAMILY};
-                font-size: {config.FONT_SIZE_NORMAL}pt;
-                padding-left: {config.SPACING_LG}px;
-                padding-top: {config.SPACING_XS}px;
-            """)
+            step_label.setProperty("role", "chainStep")
             content_layout.addWidget(step_label)
         
         # Impact
+        content_layout.addSpacing(config.SPACING_MD)
         impact_label = QLabel(f"⚠️ Impact: {attack.get('impact', 'Unknown')}")
         impact_label.setWordWrap(True)
-        impact_label.setStyleSheet(f"""
-            color: {config.COLOR_CRITICAL};
-            font-family: {config.FONT_FAMILY};
-            font-size: {config.FONT_SIZE_NORMAL}pt;
-            margin-top: {config.SPACING_MD}px;
-            font-weight: bold;
-            padding: {config.SPACING_SM}px;
-            background-color: {config.COLOR_CRITICAL}22;
-            border-radius: 4px;
-        """)
+        impact_label.setProperty("role", "impact")
         content_layout.addWidget(impact_label)
         
         card.add_layout(content_layout)
@@ -1,8 +1,10 @@
 """Cloud setup and scan execution page (merged credentials + scan)."""
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QTabWidget, QTextEdit, QProgressBar, QLabel, QHBoxLayout
-from PySide6.QtCore import Qt, QThread, Signal
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QTabWidget, QPlainTextEdit, QProgressBar, QLabel, QHBoxLayout
+from PySide6.QtCore import Qt, QThread, QTimer, Signal
 from PySide6.QtGui import QTextCursor
 import logging
+import time
+from collections import deque
 import config
 from components.section_header import SectionHeader
 from components.glow_button import GlowButton
@@ -11,26 +13,44 @@ from core.scanner import run_cloud_scan
 
 logger = logging.getLogger(__name__)
 
+# The worker queues log lines in a ring buffer that the GUI thread drains
+# every _LOG_DRAIN_MS; logs_ready is emitted at most every
+# _LOG_NOTIFY_INTERVAL seconds so a burst shows without waiting for the timer
+_LOG_BUFFER_SIZE = 10000
+_LOG_DRAIN_MS = 50
+_LOG_NOTIFY_INTERVAL = 0.05
+
+# Lines kept in the scan terminal; older ones are dropped
+_TERMINAL_MAX_LINES = 2000
+
 
 class ScanWorker(QThread):
     """Background worker for cloud validation and scanning."""
     
-    log_signal = Signal(str)
+    logs_ready = Signal()
     progress_signal = Signal(int, str)
     finished_signal = Signal(dict)
+    partial_finding_signal = Signal(dict)
     connection_signal = Signal(str, bool)  # cloud_name, success
     
     def __init__(self, credentials):
         super().__init__()
         self.credentials = credentials
+        # deque append/popleft are atomic, so the GUI thread can drain it directly
+        self.log_buffer = deque(maxlen=_LOG_BUFFER_SIZE)
+        self._last_notify = 0.0
     
     def log_step(self, message: str, delay: float = 0.4):
-        """Emit log message with realistic delay."""
-        import time
+        """Queue log message with realistic delay."""
         from datetime import datetime
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_signal.emit(f"[{timestamp}] {message}")
-        time.sleep(delay)
+        self.log_buffer.append(f"[{timestamp}] {message}")
+        now = time.monotonic()
+        if now - self._last_notify >= _LOG_NOTIFY_INTERVAL:
+            self._last_notify = now
+            self.logs_ready.emit()
+        if delay:
+            time.sleep(delay)
     
     def validate_aws(self, creds: dict) -> bool:
         """Validate AWS credentials."""
@@ -161,7 +181,7 @@ class ScanWorker(QThread):
         self.progress_signal.emit(60, "Cloud scanning complete")
         
         # Run actual scan
-        result = run_cloud_scan(self.credentials)
+        result = run_cloud_scan(self.credentials, on_finding=self.partial_finding_signal.emit)
         
         # STAGE 3: ATTACK SIMULATION
         self.log_step("========== ATTACK SIMULATION ==========", 0.2)
@@ -202,10 +222,14 @@ class CloudSetupScanPage(QWidget):
     
     scan_completed = Signal(dict)
     scan_started = Signal()
+    finding_found = Signal(dict)
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.worker = None
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(_LOG_DRAIN_MS)
+        self._log_timer.timeout.connect(self.drain_logs)
         self.setup_ui()
     
     def setup_ui(self):
@@ -294,10 +318,11 @@ class CloudSetupScanPage(QWidget):
         layout.addWidget(self.progress_bar)
         
         # Terminal
-        self.terminal = QTextEdit()
+        self.terminal = QPlainTextEdit()
         self.terminal.setReadOnly(True)
+        self.terminal.setMaximumBlockCount(_TERMINAL_MAX_LINES)
         self.terminal.setStyleSheet(f"""
-            QTextEdit {{
+            QPlainTextEdit {{
                 background-color: {config.COLOR_BACKGROUND};
                 color: {config.COLOR_PRIMARY};
                 border: 1px solid {config.COLOR_BORDER};
@@ -418,15 +443,29 @@ class CloudSetupScanPage(QWidget):
         credentials = self.get_credentials()
         
         self.worker = ScanWorker(credentials)
-        self.worker.log_signal.connect(self.append_log)
+        self.worker.logs_ready.connect(self.drain_logs)
         self.worker.progress_signal.connect(self.update_progress)
         self.worker.connection_signal.connect(self.on_cloud_connected)
         self.worker.finished_signal.connect(self.on_scan_complete)
+        self.worker.partial_finding_signal.connect(self.finding_found)
         self.worker.start()
+        self._log_timer.start()
+    
+    def drain_logs(self):
+        """Move every queued worker log line into the terminal."""
+        if self.worker is None:
+            return
+        
+        buffer = self.worker.log_buffer
+        lines = []
+        while buffer:
+            lines.append(buffer.popleft())
+        if lines:
+            self.append_logs(lines)
     
-    def append_log(self, message: str):
-        """Append message to terminal output."""
-        self.terminal.append(message)
+    def append_logs(self, messages: list):
+        """Append a batch of messages to terminal output."""
+        self.terminal.appendPlainText("\n".join(messages))
         self.terminal.moveCursor(QTextCursor.End)
     
     def update_progress(self, value: int, step: str):
@@ -446,6 +485,8 @@ class CloudSetupScanPage(QWidget):
     
     def on_scan_complete(self, result: dict):
         """Handle scan completion."""
+        self._log_timer.stop()
+        self.drain_logs()
         self.scan_btn.setEnabled(True)
         self.progress_label.setText("Scan complete!")
         
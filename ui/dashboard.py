@@ -1,15 +1,94 @@
 """Dashboard page with overview statistics."""
+import bisect
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QGridLayout, QListWidget, QListWidgetItem
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QSize, QRectF
+from PySide6.QtGui import QPixmap, QPainter, QPen, QColor, QFont
 import config
 from components.section_header import SectionHeader
 from components.metric_card import MetricCard
 from components.cyber_card import CyberCard
 
+# Metric colour for each risk level reported by the risk engine
+_RISK_COLORS = {
+    "Low": config.COLOR_PRIMARY,
+    "Medium": config.COLOR_WARNING,
+    "High": config.COLOR_CRITICAL,
+    "Critical": config.COLOR_CRITICAL
+}
+
+# Security score colour bands: < 60 critical, 60-79 warning, >= 80 healthy
+_SCORE_THRESHOLDS = [60, 80]
+_SCORE_COLORS = [config.COLOR_CRITICAL, config.COLOR_WARNING, config.COLOR_PRIMARY]
+
+
+class _ChartPlaceholder(QLabel):
+    """Dashed placeholder panel painted once into a cached pixmap."""
+    
+    def __init__(self, text: str, parent=None):
+        """
+        Initialize chart placeholder.
+        
+        Args:
+            text: Placeholder caption
+            parent: Parent widget
+        """
+        super().__init__(parent)
+        self._text = text
+        font = QFont()
+        font.setFamilies([family.strip() for family in config.FONT_FAMILY.split(",")])
+        font.setPointSize(config.FONT_SIZE_NORMAL)
+        self.setFont(font)
+        self.setAlignment(Qt.AlignCenter)
+        
+    def sizeHint(self) -> QSize:
+        """Size of the caption plus the placeholder padding."""
+        metrics = self.fontMetrics()
+        return QSize(
+            metrics.horizontalAdvance(self._text) + 2 * config.SPACING_XL,
+            metrics.height() + 2 * config.SPACING_XL
+        )
+        
+    def minimumSizeHint(self) -> QSize:
+        """Allow shrinking below the cached pixmap size."""
+        return QSize(0, self.sizeHint().height())
+        
+    def resizeEvent(self, event):
+        """Re-render the cached pixmap for the new size."""
+        super().resizeEvent(event)
+        self.setPixmap(self._render(event.size()))
+        
+    def _render(self, size: QSize) -> QPixmap:
+        """Paint border, background and caption into a pixmap."""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(size * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        pen = QPen(QColor(config.COLOR_BORDER), 1, Qt.DashLine)
+        painter.setPen(pen)
+        painter.setBrush(QColor(config.COLOR_BACKGROUND))
+        rect = QRectF(0.5, 0.5, size.width() - 1, size.height() - 1)
+        painter.drawRoundedRect(rect, 4, 4)
+        painter.setPen(QColor(config.COLOR_TEXT))
+        painter.setFont(self.font())
+        painter.drawText(rect, Qt.AlignCenter, self._text)
+        painter.end()
+        return pixmap
+
 
 class DashboardPage(QWidget):
     """Main dashboard with security overview."""
     
+    # Style for the scan history labels. It is applied once in setup_ui and
+    # never changes; update_stats only calls setText on these labels.
+    _MUTED_LABEL_CSS = f"""
+        color: {config.COLOR_TEXT}88;
+        font-family: {config.FONT_FAMILY};
+        font-size: {config.FONT_SIZE_NORMAL}pt;
+    """
+    
     def __init__(self, parent=None):
         """Initialize dashboard page."""
         super().__init__(parent)
@@ -66,30 +145,10 @@ class DashboardPage(QWidget):
         insights_layout.setSpacing(config.SPACING_SM)
         
         # Placeholder for charts
-        chart_label = QLabel("📊 Security Score Distribution")
-        chart_label.setStyleSheet(f"""
-            color: {config.COLOR_TEXT};
-            font-family: {config.FONT_FAMILY};
-            font-size: {config.FONT_SIZE_NORMAL}pt;
-            padding: {config.SPACING_XL}px;
-            background-color: {config.COLOR_BACKGROUND};
-            border: 1px dashed {config.COLOR_BORDER};
-            border-radius: 4px;
-        """)
-        chart_label.setAlignment(Qt.AlignCenter)
+        chart_label = _ChartPlaceholder("📊 Security Score Distribution")
         insights_layout.addWidget(chart_label)
         
-        findings_label = QLabel("📈 Findings by Cloud Provider")
-        findings_label.setStyleSheet(f"""
-            color: {config.COLOR_TEXT};
-            font-family: {config.FONT_FAMILY};
-            font-size: {config.FONT_SIZE_NORMAL}pt;
-            padding: {config.SPACING_XL}px;
-            background-color: {config.COLOR_BACKGROUND};
-            border: 1px dashed {config.COLOR_BORDER};
-            border-radius: 4px;
-        """)
-        findings_label.setAlignment(Qt.AlignCenter)
+        findings_label = _ChartPlaceholder("📈 Findings by Cloud Provider")
         insights_layout.addWidget(findings_label)
         
         insights_card.add_layout(insights_layout)
@@ -132,19 +191,11 @@ class DashboardPage(QWidget):
         history_layout.setSpacing(config.SPACING_MD)
         
         self.last_scan_label = QLabel(f"Last Scan: {history_stats['last_scan']}")
-        self.last_scan_label.setStyleSheet(f"""
-            color: {config.COLOR_TEXT}88;
-            font-family: {config.FONT_FAMILY};
-            font-size: {config.FONT_SIZE_NORMAL}pt;
-        """)
+        self.last_scan_label.setStyleSheet(self._MUTED_LABEL_CSS)
         history_layout.addWidget(self.last_scan_label)
         
         self.total_scans_label = QLabel(f"Total Scans: {history_stats['total_scans']}")
-        self.total_scans_label.setStyleSheet(f"""
-            color: {config.COLOR_TEXT}88;
-            font-family: {config.FONT_FAMILY};
-            font-size: {config.FONT_SIZE_NORMAL}pt;
-        """)
+        self.total_scans_label.setStyleSheet(self._MUTED_LABEL_CSS)
         history_layout.addWidget(self.total_scans_label)
         
         history_layout.addStretch()
@@ -157,7 +208,6 @@ class DashboardPage(QWidget):
         Args:
             result: Scan result with findings, attacks, and risk
         """
-        from core.scan_history import ScanHistory
         from datetime import datetime
         
         risk = result.get('risk', {})
@@ -168,21 +218,10 @@ class DashboardPage(QWidget):
         risk_level = risk.get('risk_level', 'Unknown')
         
         # Determine score color
-        if security_score >= 80:
-            score_color = config.COLOR_PRIMARY
-        elif security_score >= 60:
-            score_color = config.COLOR_WARNING
-        else:
-            score_color = config.COLOR_CRITICAL
+        score_color = _SCORE_COLORS[bisect.bisect_right(_SCORE_THRESHOLDS, security_score)]
         
         # Determine risk level color
-        risk_colors = {
-            "Low": config.COLOR_PRIMARY,
-            "Medium": config.COLOR_WARNING,
-            "High": config.COLOR_CRITICAL,
-            "Critical": config.COLOR_CRITICAL
-        }
-        risk_color = risk_colors.get(risk_level, config.COLOR_TEXT)
+        risk_color = _RISK_COLORS.get(risk_level, config.COLOR_TEXT)
         
         # Update metric cards
         self.metric_cards["security_score"].update_value(str(security_score), score_color)
@@ -190,16 +229,22 @@ class DashboardPage(QWidget):
         self.metric_cards["attack_paths"].update_value(str(len(attacks)), config.COLOR_CRITICAL)
         self.metric_cards["risk_level"].update_value(risk_level, risk_color)
         
-        # Update history labels
-        history_stats = ScanHistory.get_stats()
-        self.last_scan_label.setText(f"Last Scan: {history_stats['last_scan']}")
-        self.total_scans_label.setText(f"Total Scans: {history_stats['total_scans']}")
+        self.update_history()
         
         # Add activity to feed
         self.add_activity(f"🔍 Scan completed - {len(findings)} findings")
         self.add_activity(f"📊 Risk score: {security_score}")
         self.add_activity(f"⚔️ {len(attacks)} attack paths identified")
 
+    def update_history(self):
+        """Refresh the scan history labels from the history file."""
+        from core.scan_history import ScanHistory
+        
+        # Text only, the style is fixed in setup_ui
+        history_stats = ScanHistory.get_stats()
+        self.last_scan_label.setText(f"Last Scan: {history_stats['last_scan']}")
+        self.total_scans_label.setText(f"Total Scans: {history_stats['total_scans']}")
+
     def add_activity(self, message: str):
         """
         Add activity to feed.
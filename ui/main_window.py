@@ -1,9 +1,11 @@
 """Main application window."""
+import hashlib
+import json
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QStackedWidget, QLabel
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 import config
 
 from ui.dashboard import DashboardPage
@@ -12,6 +14,30 @@ from ui.attack_page import AttackPage
 from ui.report_page import ReportPage
 
 
+def _nav_qss(is_active: bool) -> str:
+    """Build the sidebar button stylesheet for the active or inactive state."""
+    return f"""
+        QPushButton {{
+            background-color: {config.COLOR_PRIMARY + '22' if is_active else 'transparent'};
+            color: {config.COLOR_PRIMARY if is_active else config.COLOR_TEXT};
+            border: none;
+            border-left: 3px solid {config.COLOR_PRIMARY if is_active else 'transparent'};
+            text-align: left;
+            padding: {config.SPACING_MD}px {config.SPACING_LG}px;
+            font-family: {config.FONT_FAMILY};
+            font-size: {config.FONT_SIZE_NORMAL}pt;
+            font-weight: {'bold' if is_active else 'normal'};
+        }}
+        QPushButton:hover {{
+            background-color: {config.COLOR_PRIMARY}11;
+        }}
+    """
+
+
+# Sidebar button stylesheets, formatted once at import
+_NAV_QSS = {True: _nav_qss(True), False: _nav_qss(False)}
+
+
 class MainWindow(QMainWindow):
     """CloudStrike main application window."""
 
@@ -19,6 +45,7 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.last_scan_time = "Never"
         self.scan_status = "Ready"
+        self._last_result_digest = None
         self.setup_ui()
 
     # ---------------- MAIN UI ---------------- #
@@ -27,10 +54,28 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("CloudStrike - Cloud Security Auditor")
         self.setMinimumSize(config.WINDOW_MIN_WIDTH, config.WINDOW_MIN_HEIGHT)
 
+        # Chrome styling lives in this one sheet and is matched by object name
         self.setStyleSheet(f"""
             QMainWindow {{
                 background-color: {config.COLOR_BACKGROUND};
             }}
+            #header_bar {{
+                background-color: {config.COLOR_CARD};
+                border-bottom: 1px solid {config.COLOR_BORDER};
+            }}
+            #sidebar {{
+                background-color: {config.COLOR_CARD};
+                border-right: 1px solid {config.COLOR_BORDER};
+            }}
+            #header_bar QLabel, #sidebar QLabel {{
+                background-color: {config.COLOR_CARD};
+            }}
+            #version_label {{
+                color: {config.COLOR_TEXT}66;
+                font-family: {config.FONT_FAMILY};
+                font-size: 8pt;
+                padding: {config.SPACING_SM}px;
+            }}
         """)
 
         central_widget = QWidget()
@@ -58,29 +103,33 @@ class MainWindow(QMainWindow):
         self.attack_page = AttackPage()
         self.report_page = ReportPage()
 
-        self.pages.addWidget(self.dashboard_page)
-        self.pages.addWidget(self.cloud_setup_scan_page)
-        self.pages.addWidget(self.attack_page)
-        self.pages.addWidget(self.report_page)
-
-        self.cloud_setup_scan_page.scan_completed.connect(self.on_scan_complete)
-        self.cloud_setup_scan_page.scan_started.connect(self.on_scan_started)
+        for idx, page in enumerate((
+            self.dashboard_page,
+            self.cloud_setup_scan_page,
+            self.attack_page,
+            self.report_page
+        )):
+            self._wire_page(idx, page)
 
         content_layout.addWidget(self.pages)
         main_layout.addLayout(content_layout)
 
+    def _wire_page(self, idx: int, page: QWidget):
+        """Place a page in the stack at idx and connect its signals."""
+        self.pages.insertWidget(idx, page)
+
+        if isinstance(page, CloudSetupScanPage):
+            page.scan_completed.connect(self.on_scan_complete)
+            page.scan_started.connect(self.on_scan_started)
+            page.finding_found.connect(self.on_finding_found)
+
     # ---------------- SIDEBAR ---------------- #
 
     def create_sidebar(self) -> QWidget:
         sidebar = QWidget()
         sidebar.setFixedWidth(240)   # ⭐ FIXED WIDTH (was too small)
-
-        sidebar.setStyleSheet(f"""
-            QWidget {{
-                background-color: {config.COLOR_CARD};
-                border-right: 1px solid {config.COLOR_BORDER};
-            }}
-        """)
+        sidebar.setObjectName("sidebar")
+        sidebar.setAttribute(Qt.WA_StyledBackground, True)
 
         layout = QVBoxLayout(sidebar)
 
@@ -118,12 +167,7 @@ class MainWindow(QMainWindow):
         layout.addStretch()
 
         version_label = QLabel("v1.0.0-alpha")
-        version_label.setStyleSheet(f"""
-            color: {config.COLOR_TEXT}66;
-            font-family: {config.FONT_FAMILY};
-            font-size: 8pt;
-            padding: {config.SPACING_SM}px;
-        """)
+        version_label.setObjectName("version_label")
         version_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(version_label)
 
@@ -157,35 +201,15 @@ class MainWindow(QMainWindow):
     def update_nav_styles(self):
         for btn in self.nav_buttons:
             is_active = btn.property("active")
-            btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {config.COLOR_PRIMARY + '22' if is_active else 'transparent'};
-                    color: {config.COLOR_PRIMARY if is_active else config.COLOR_TEXT};
-                    border: none;
-                    border-left: 3px solid {config.COLOR_PRIMARY if is_active else 'transparent'};
-                    text-align: left;
-                    padding: {config.SPACING_MD}px {config.SPACING_LG}px;
-                    font-family: {config.FONT_FAMILY};
-                    font-size: {config.FONT_SIZE_NORMAL}pt;
-                    font-weight: {'bold' if is_active else 'normal'};
-                }}
-                QPushButton:hover {{
-                    background-color: {config.COLOR_PRIMARY}11;
-                }}
-            """)
+            btn.setStyleSheet(_NAV_QSS[bool(is_active)])
 
     # ---------------- HEADER ---------------- #
 
     def create_header_bar(self) -> QWidget:
         header = QWidget()
         header.setFixedHeight(60)
-
-        header.setStyleSheet("""
-            QWidget {
-                background-color: #111827;
-                border-bottom: 1px solid #1f2937;
-            }
-        """)
+        header.setObjectName("header_bar")
+        header.setAttribute(Qt.WA_StyledBackground, True)
 
         layout = QHBoxLayout(header)
 
@@ -232,15 +256,14 @@ class MainWindow(QMainWindow):
         show_toast(self, "Scan started")
         self.dashboard_page.add_activity("🔍 Cloud scan initiated")
 
+    def on_finding_found(self, finding: dict):
+        self.report_page.append_finding(finding)
+
     def on_scan_complete(self, result: dict):
         from core.scan_history import ScanHistory
         from datetime import datetime
-        from components.toast import show_toast
 
         ScanHistory.save_scan(result)
-        self.dashboard_page.update_stats(result)
-        self.attack_page.update_attacks(result.get('attacks', []))
-        self.report_page.update_findings(result)
 
         self.last_scan_time = datetime.now().strftime("%H:%M:%S")
         self.last_scan_label.setText(f"Last Scan: {self.last_scan_time}")
@@ -249,15 +272,56 @@ class MainWindow(QMainWindow):
         self.status_badge.setText(self.scan_status)
         self.status_badge.setup_style("info")
 
+        # Identical consecutive results leave the pages as they are
+        digest = hashlib.blake2b(
+            json.dumps(result, sort_keys=True, default=str).encode(),
+            digest_size=16
+        ).digest()
+        if digest == self._last_result_digest:
+            from components.toast import show_toast
+            self.dashboard_page.update_history()
+            has_content = bool(result.get('findings')) or bool(result.get('attacks'))
+            # Streamed cards replaced the report, so only it needs the result again
+            if self.report_page.is_streaming():
+                if has_content:
+                    self.report_page.update_findings(result)
+                else:
+                    self.report_page.show_empty_state(result)
+            show_toast(self, "Scan complete! No changes since last scan")
+            # Land on the same page as a scan whose result was applied
+            self.navigate_to(2 if has_content else 0)
+            return
+
+        # Apply the page updates on the next event loop pass so they are
+        # coalesced into a single repaint
+        QTimer.singleShot(0, lambda r=result, d=digest: self._apply_scan_result(r, d))
+
+    def _apply_scan_result(self, result: dict, digest: bytes = None):
+        """Push a scan result into the pages with repaints suspended."""
+        from components.toast import show_toast
+
+        has_content = bool(result.get('findings')) or bool(result.get('attacks'))
+
+        self.setUpdatesEnabled(False)
+        try:
+            self.dashboard_page.update_stats(result)
+            self.attack_page.update_attacks(result.get('attacks', []))
+            if has_content:
+                self.report_page.update_findings(result)
+            else:
+                self.report_page.show_empty_state(result)
+
+            # Add activity logs
+            self.dashboard_page.add_activity("⚔️ Attack paths generated")
+            self.dashboard_page.add_activity("📊 Risk score calculated")
+            self.dashboard_page.add_activity("🛠️ Remediation scripts created")
+        finally:
+            self.setUpdatesEnabled(True)
+        self._last_result_digest = digest
+
         findings_count = len(result.get('findings', []))
-        attacks_count = len(result.get('attacks', []))
-        
-        # Add activity logs
-        self.dashboard_page.add_activity("⚔️ Attack paths generated")
-        self.dashboard_page.add_activity("📊 Risk score calculated")
-        self.dashboard_page.add_activity("🛠️ Remediation scripts created")
-        
         show_toast(self, f"Scan complete! Found {findings_count} issues")
 
-        # Auto-navigate to Attack Simulation page
-        self.navigate_to(2)
+        # Auto-navigate to Attack Simulation page, or to the dashboard
+        # (which already shows the new counts) when there is nothing to show
+        self.navigate_to(2 if has_content else 0)
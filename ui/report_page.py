@@ -1,13 +1,433 @@
 """Security findings report page."""
+import hashlib
+import json
+from datetime import datetime
+from functools import lru_cache
+from typing import NamedTuple
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QScrollArea, QLabel, QTextEdit, 
-    QPushButton, QHBoxLayout, QApplication, QGridLayout, QProgressBar
+    QWidget, QVBoxLayout, QScrollArea, QLabel, QPlainTextEdit, 
+    QPushButton, QHBoxLayout, QApplication, QGridLayout, QProgressBar,
+    QFileDialog
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QThread, QTimer, Signal
 import config
 from components.section_header import SectionHeader
 from components.cyber_card import CyberCard
-from components.status_badge import StatusBadge
+from components.status_badge import badge_pixmap
+from components.glow_button import GlowButton
+from components.toast import show_toast
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # optional, falls back to the json module
+
+
+# Card styling lives in assets/report.qss, loaded once on the QApplication.
+# Widgets here only carry a "role" property or a colour-variant object name.
+
+# Vulnerability cards are bound in batches of this size; the cards not yet
+# bound are stood in for by a stub, and the next batch is bound once that
+# stub scrolls into view
+_CARD_BATCH = 20
+
+# Findings listed in the PDF report; the rest only count towards the total
+_PDF_MAX_FINDINGS = 10
+
+# Colour variant for each risk level shown on the risk level card
+_LEVEL_VARIANTS = {"CRITICAL": "Crit", "HIGH": "Crit", "MEDIUM": "Warn"}
+
+
+def _score_variant(score: int) -> str:
+    """Colour variant suffix for a security score."""
+    if score >= 80:
+        return "Ok"
+    if score >= 60:
+        return "Warn"
+    return "Crit"
+
+
+def _serialize_result(result: dict) -> bytes:
+    """Serialize a scan result to the indented JSON written by exports."""
+    if orjson is not None:
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(result, indent=2).encode('utf-8')
+
+
+def _preserialize_result(result: dict):
+    """
+    Serialize a result ahead of export when orjson makes that cheap.
+    
+    Returns None without orjson, or when orjson rejects a value in the result
+    (sets, custom objects); the export worker then serializes it and reports
+    any failure.
+    """
+    if orjson is None:
+        return None
+    try:
+        return _serialize_result(result)
+    except (TypeError, orjson.JSONEncodeError):
+        return None
+
+
+class _PdfFinding(NamedTuple):
+    """The parts of a finding printed in the PDF report."""
+    title: str
+    severity: str
+    description: str
+
+
+@lru_cache(maxsize=512)
+def _short_description(description: str) -> tuple:
+    """Truncated card text for a description, and whether it was truncated."""
+    if len(description) > 100:
+        return description[:100] + "...", True
+    return description, False
+
+
+class _CollapsibleCard(CyberCard):
+    """Collapsible vulnerability card that can be rebound to another finding."""
+    
+    def __init__(self, copy_callback, parent=None):
+        """
+        Initialize an empty vulnerability card.
+        
+        Args:
+            copy_callback: Called with the script text when a copy button is clicked
+            parent: Parent widget
+        """
+        super().__init__(parent=parent)
+        self._copy_callback = copy_callback
+        self._desc_is_long = False
+        
+        main_layout = QVBoxLayout()
+        main_layout.setSpacing(12)
+        
+        # Collapsed header (always visible)
+        header_layout = QHBoxLayout()
+        
+        self.title_label = QLabel()
+        self.title_label.setProperty("role", "vulnTitle")
+        header_layout.addWidget(self.title_label)
+        header_layout.addStretch()
+        
+        self.severity_badge = QLabel()
+        header_layout.addWidget(self.severity_badge)
+        
+        self.cloud_badge = QLabel()
+        header_layout.addWidget(self.cloud_badge)
+        
+        main_layout.addLayout(header_layout)
+        
+        # Short description (always visible)
+        self.desc_label = QLabel()
+        self.desc_label.setWordWrap(True)
+        self.desc_label.setProperty("role", "shortDesc")
+        main_layout.addWidget(self.desc_label)
+        
+        # Expandable details container, filled on first expand
+        self.details_widget = QWidget()
+        self.details_widget.setVisible(False)
+        self._details_built = False
+        self._payload = ({}, None, None)
+        
+        main_layout.addWidget(self.details_widget)
+        
+        # Toggle button
+        self.toggle_btn = QPushButton("View Details ▼")
+        self.toggle_btn.setProperty("role", "toggleBtn")
+        self.toggle_btn.clicked.connect(self.toggle_details)
+        main_layout.addWidget(self.toggle_btn)
+        
+        self.add_layout(main_layout)
+        
+    def rebind(self, finding: dict, remediation: dict = None, attack: dict = None):
+        """Show another finding, reusing the existing widgets."""
+        self.title_label.setText(finding["title"])
+        
+        severity = finding["severity"]
+        self.severity_badge.setPixmap(badge_pixmap(severity, severity.lower()))
+        self.cloud_badge.setPixmap(badge_pixmap(finding["cloud"], "info"))
+        
+        short_desc, self._desc_is_long = _short_description(finding["description"])
+        self.desc_label.setText(short_desc)
+        
+        self._payload = (finding, remediation, attack)
+        if self._details_built:
+            self._bind_details()
+        
+        # A rebound card always starts collapsed
+        self.details_widget.setVisible(False)
+        self.toggle_btn.setText("View Details ▼")
+        
+    def _populate_details(self):
+        """Build the details widgets; only runs the first time a card expands."""
+        details_layout = QVBoxLayout(self.details_widget)
+        details_layout.setContentsMargins(0, 12, 0, 0)
+        details_layout.setSpacing(12)
+        
+        # Full description
+        self.full_desc = QLabel()
+        self.full_desc.setWordWrap(True)
+        self.full_desc.setProperty("role", "fullDesc")
+        details_layout.addWidget(self.full_desc)
+        
+        # Attack Path subsection
+        self.attack_section = QWidget()
+        attack_layout = QVBoxLayout(self.attack_section)
+        attack_layout.setContentsMargins(0, 0, 0, 0)
+        attack_layout.setSpacing(12)
+        
+        attack_layout.addSpacing(config.SPACING_SM)
+        attack_header = QLabel("Attack Path")
+        attack_header.setProperty("role", "subheader")
+        attack_layout.addWidget(attack_header)
+        
+        self.attack_label = QLabel()
+        self.attack_label.setWordWrap(True)
+        self.attack_label.setProperty("role", "attackTitle")
+        attack_layout.addWidget(self.attack_label)
+        
+        details_layout.addWidget(self.attack_section)
+        
+        # Remediation subsections
+        self.remediation_section = QWidget()
+        remediation_layout = QVBoxLayout(self.remediation_section)
+        remediation_layout.setContentsMargins(0, 0, 0, 0)
+        remediation_layout.setSpacing(12)
+        
+        # CLI Fix
+        remediation_layout.addSpacing(config.SPACING_SM)
+        cli_header = QLabel("CLI Fix")
+        cli_header.setProperty("role", "subheader")
+        remediation_layout.addWidget(cli_header)
+        
+        self.cli_text = QPlainTextEdit()
+        self.cli_text.setReadOnly(True)
+        self.cli_text.setMaximumHeight(80)
+        self.cli_text.setProperty("role", "cliCode")
+        remediation_layout.addWidget(self.cli_text)
+        
+        self.cli_copy_btn = QPushButton("📋 Copy CLI")
+        self.cli_copy_btn.clicked.connect(self._on_copy_clicked)
+        self.cli_copy_btn.setProperty("role", "copyBtn")
+        self.cli_copy_btn.setProperty("variant", "primary")
+        remediation_layout.addWidget(self.cli_copy_btn, alignment=Qt.AlignLeft)
+        
+        # Terraform Fix
+        remediation_layout.addSpacing(config.SPACING_SM)
+        tf_header = QLabel("Terraform Fix")
+        tf_header.setProperty("role", "subheader")
+        remediation_layout.addWidget(tf_header)
+        
+        self.tf_text = QPlainTextEdit()
+        self.tf_text.setReadOnly(True)
+        self.tf_text.setMaximumHeight(80)
+        self.tf_text.setProperty("role", "tfCode")
+        remediation_layout.addWidget(self.tf_text)
+        
+        self.tf_copy_btn = QPushButton("📋 Copy Terraform")
+        self.tf_copy_btn.clicked.connect(self._on_copy_clicked)
+        self.tf_copy_btn.setProperty("role", "copyBtn")
+        self.tf_copy_btn.setProperty("variant", "accent")
+        remediation_layout.addWidget(self.tf_copy_btn, alignment=Qt.AlignLeft)
+        
+        details_layout.addWidget(self.remediation_section)
+        
+        self._details_built = True
+        self._bind_details()
+        
+    def _bind_details(self):
+        """Show the current payload in the details widgets."""
+        finding, remediation, attack = self._payload
+        
+        self.full_desc.setText(finding["description"] if self._desc_is_long else "")
+        self.full_desc.setVisible(self._desc_is_long)
+        
+        self.attack_label.setText(attack['title'] if attack else "")
+        self.attack_section.setVisible(bool(attack))
+        
+        # Each copy button carries its own text, so one slot serves both
+        scripts = remediation or {}
+        cli_script = scripts.get("cli_script", "")
+        terraform = scripts.get("terraform", "")
+        # Rebinding onto the same script skips the document re-layout
+        if cli_script != self.cli_copy_btn.property("clip_text"):
+            self.cli_text.setPlainText(cli_script)
+            self.cli_copy_btn.setProperty("clip_text", cli_script)
+        if terraform != self.tf_copy_btn.property("clip_text"):
+            self.tf_text.setPlainText(terraform)
+            self.tf_copy_btn.setProperty("clip_text", terraform)
+        self.remediation_section.setVisible(bool(remediation))
+        
+    def _on_copy_clicked(self):
+        """Copy the text stored on whichever copy button was clicked."""
+        self._copy_callback(self.sender().property("clip_text"))
+        
+    def toggle_details(self):
+        """Expand or collapse the details section."""
+        if not self._details_built:
+            self._populate_details()
+        is_visible = self.details_widget.isVisible()
+        self.details_widget.setVisible(not is_visible)
+        self.toggle_btn.setText("Hide Details ▲" if not is_visible else "View Details ▼")
+
+
+class JsonExportWorker(QThread):
+    """Background worker that serializes and writes the JSON report."""
+    
+    finished_signal = Signal(str, str)  # file_path, error message ("" on success)
+    
+    def __init__(self, result: dict, file_path: str, data: bytes = None):
+        super().__init__()
+        self.file_path = file_path
+        self.data = data
+        # Streamed findings are appended to the shown result's lists while a
+        # scan runs, so a worker that serializes gets its own copy of them
+        self.result = None
+        if data is None:
+            self.result = {
+                key: list(value) if isinstance(value, list) else value
+                for key, value in result.items()
+            }
+    
+    def run(self):
+        """Serialize the result, unless already serialized, and write it to disk."""
+        try:
+            data = self.data if self.data is not None else _serialize_result(self.result)
+            
+            # Serialize in memory, then hand the bytes to a large write buffer
+            with open(self.file_path, 'wb', buffering=1 << 20) as f:
+                f.write(data)
+            
+            self.finished_signal.emit(self.file_path, "")
+        except Exception as e:
+            self.finished_signal.emit(self.file_path, f"Export failed: {str(e)}")
+
+
+class PdfExportWorker(QThread):
+    """Background worker that builds the PDF report off the GUI thread."""
+    
+    finished_signal = Signal(str, str)  # file_path, error message ("" on success)
+    
+    def __init__(self, result: dict, file_path: str):
+        super().__init__()
+        # Snapshot only what the PDF prints, as immutable records, rather than
+        # deep-copying the whole result; the GUI thread may replace or extend
+        # its result mid-export
+        findings = result.get('findings', [])
+        self.risk = dict(result.get('risk', {}))
+        self.findings_count = len(findings)
+        self.attacks_count = len(result.get('attacks', []))
+        self.findings = tuple(
+            _PdfFinding(finding['title'], finding['severity'], finding['description'])
+            for finding in findings[:_PDF_MAX_FINDINGS]
+        )
+        self.file_path = file_path
+    
+    def run(self):
+        """Build and write the PDF report."""
+        try:
+            from reportlab.lib.pagesizes import letter
+            from reportlab.lib import colors
+            from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+            from reportlab.platypus import SimpleDocTemplate, Paragraph, Table, TableStyle
+            from reportlab.lib.units import inch
+            from reportlab.lib.utils import simpleSplit
+            
+            doc = SimpleDocTemplate(self.file_path, pagesize=letter)
+            story = []
+            styles = getSampleStyleSheet()
+            
+            # Gaps between sections ride on each flowable's spaceAfter instead
+            # of a Spacer flowable after each one
+            title_style = ParagraphStyle(
+                'ReportTitle', parent=styles['Title'],
+                spaceAfter=styles['Title'].spaceAfter + 0.2*inch
+            )
+            timestamp_style = ParagraphStyle(
+                'ReportTimestamp', parent=styles['Normal'],
+                spaceAfter=styles['Normal'].spaceAfter + 0.3*inch
+            )
+            heading_style = ParagraphStyle(
+                'ReportHeading', parent=styles['Heading2'],
+                spaceAfter=styles['Heading2'].spaceAfter + 0.1*inch
+            )
+            
+            # Title
+            title = Paragraph("<b>CloudStrike Security Report</b>", title_style)
+            story.append(title)
+            
+            # Timestamp
+            timestamp = Paragraph(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", timestamp_style)
+            story.append(timestamp)
+            
+            # Risk Summary
+            risk = self.risk
+            summary_data = [
+                ['Security Score', str(risk.get('security_score', 0))],
+                ['Risk Level', risk.get('risk_level', 'Unknown')],
+                ['Total Findings', str(self.findings_count)],
+                ['Attack Paths', str(self.attacks_count)]
+            ]
+            
+            summary_table = Table(summary_data, colWidths=[3*inch, 2*inch], spaceAfter=0.3*inch)
+            summary_table.setStyle(TableStyle([
+                ('BACKGROUND', (0, 0), (-1, -1), colors.lightgrey),
+                ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (-1, -1), 12),
+                ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+                ('GRID', (0, 0), (-1, -1), 1, colors.black)
+            ]))
+            
+            story.append(summary_table)
+            
+            # Findings
+            story.append(Paragraph("<b>Security Findings</b>", heading_style))
+            
+            # One table for all findings instead of a Paragraph per finding:
+            # bold title lines then description lines, pre-wrapped to the frame
+            # width (less its 6pt side paddings) so no markup is parsed. Each
+            # wrapped line is its own row, so long findings split across pages
+            text_width = doc.width - 12
+            findings_data = []
+            findings_style = [
+                ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+                ('FONTSIZE', (0, 0), (-1, -1), 10),
+                ('LEADING', (0, 0), (-1, -1), 12),
+                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+                ('LEFTPADDING', (0, 0), (-1, -1), 0),
+                ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+                ('TOPPADDING', (0, 0), (-1, -1), 0),
+                ('BOTTOMPADDING', (0, 0), (-1, -1), 0)
+            ]
+            for finding in self.findings:
+                heading = f"{finding.title} [{finding.severity}]"
+                heading_lines = simpleSplit(heading, 'Helvetica-Bold', 10, text_width) or [""]
+                desc_lines = simpleSplit(finding.description, 'Helvetica', 10, text_width) or [""]
+                first = len(findings_data)
+                findings_data.extend([line] for line in heading_lines)
+                findings_style.append(('FONTNAME', (0, first), (0, len(findings_data) - 1), 'Helvetica-Bold'))
+                findings_data.extend([line] for line in desc_lines)
+                # The gap between findings sits under the last description line
+                last = len(findings_data) - 1
+                findings_style.append(('BOTTOMPADDING', (0, last), (0, last), 0.1*inch))
+            
+            if findings_data:
+                findings_table = Table(findings_data, colWidths=[text_width])
+                findings_table.setStyle(TableStyle(findings_style))
+                story.append(findings_table)
+            
+            doc.build(story)
+            
+            self.finished_signal.emit(self.file_path, "")
+            
+        except ImportError:
+            self.finished_signal.emit(self.file_path, "PDF export requires reportlab. Install: pip install reportlab")
+        except Exception as e:
+            self.finished_signal.emit(self.file_path, f"Export failed: {str(e)}")
 
 
 class ReportPage(QWidget):
@@ -18,6 +438,11 @@ class ReportPage(QWidget):
         super().__init__(parent)
         self.findings = []
         self.current_result = {}
+        self._json_bytes = None  # current_result pre-serialized for JSON export
+        self._last_result_hash = None  # digest of the result the cards show
+        self._json_worker = None
+        self._pdf_worker = None
+        self._clipboard = QApplication.clipboard()
         self.setup_ui()
         
     def setup_ui(self):
@@ -30,12 +455,10 @@ class ReportPage(QWidget):
         # Scroll area
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: transparent;
-            }
-        """)
+        scroll.setObjectName("reportScroll")
+        scroll.verticalScrollBar().valueChanged.connect(self._on_scroll)
+        scroll.verticalScrollBar().rangeChanged.connect(lambda *_: self._on_scroll())
+        self.scroll = scroll
         
         # Container for centered content
         scroll_content = QWidget()
@@ -57,7 +480,6 @@ class ReportPage(QWidget):
         header_layout.setSpacing(config.SPACING_MD)
         header_layout.addStretch()
         
-        from components.glow_button import GlowButton
         self.export_json_btn = GlowButton("Export JSON")
         self.export_json_btn.clicked.connect(self.export_json)
         header_layout.addWidget(self.export_json_btn)
@@ -68,8 +490,33 @@ class ReportPage(QWidget):
         
         self.findings_layout.addLayout(header_layout)
         
-        # Empty state
-        self.empty_card = None
+        # Empty state (built once, toggled by update_findings/show_empty_state)
+        self.empty_card = self.create_empty_card()
+        self.empty_card.setVisible(False)
+        self.findings_layout.addWidget(self.empty_card)
+        
+        # Executive summary, rebuilt for every result
+        self.summary_section = None
+        
+        # Vulnerability cards, pooled and rebound across results
+        self._card_pool = []
+        self._active_cards = 0
+        self._card_payloads = []
+        self._card_row_height = 0
+        self._streaming = False
+        self._append_pending = False
+        self.cards_container = QWidget()
+        self.cards_layout = QVBoxLayout(self.cards_container)
+        self.cards_layout.setSpacing(32)
+        self.cards_layout.setContentsMargins(0, 0, 0, 0)
+        self.cards_layout.addWidget(SectionHeader("🔍 Risks & Findings"))
+        
+        # Stands in for the cards not bound yet so the scroll range stays true
+        self._cards_stub = QWidget()
+        self._cards_stub.setVisible(False)
+        self.cards_layout.addWidget(self._cards_stub)
+        self.cards_container.setVisible(False)
+        self.findings_layout.addWidget(self.cards_container)
         
         self.findings_layout.addStretch()
         
@@ -88,109 +535,273 @@ class ReportPage(QWidget):
         Args:
             result: Dictionary with 'findings', 'risk', and 'remediation'
         """
+        # Serialize for export up front when orjson makes that cheap; the
+        # stdlib fallback is left to the export worker to keep this thread free
+        json_bytes = _preserialize_result(result)
+        result_hash = None
+        if json_bytes is not None:
+            result_hash = hashlib.blake2b(json_bytes, digest_size=16).digest()
+        
         self.current_result = result
+        self._json_bytes = json_bytes
+        # Same content as the cards already show: nothing to rebuild. Streamed
+        # cards still need the final result bound, so never skip those
+        if result_hash is not None and result_hash == self._last_result_hash and not self._streaming:
+            return
+        self._last_result_hash = result_hash
+        
         self.findings = result.get('findings', [])
+        self._streaming = False
+        # Re-measure the stub row height from this result's cards
+        self._card_row_height = 0
         risk = result.get('risk', {})
         remediation = result.get('remediation', [])
         attacks = result.get('attacks', [])
         
-        # Clear existing widgets (skip first item which is header with export buttons)
-        while self.findings_layout.count() > 1:
-            item = self.findings_layout.takeAt(1)
-            if item.widget():
-                item.widget().deleteLater()
-            elif item.layout():
-                while item.layout().count():
-                    child = item.layout().takeAt(0)
-                    if child.widget():
-                        child.widget().deleteLater()
-        
-        if not self.findings:
-            empty_card = CyberCard()
-            empty_layout = QVBoxLayout()
-            empty_layout.setAlignment(Qt.AlignCenter)
-            empty_layout.setSpacing(config.SPACING_SM)
-            
-            icon_label = QLabel("🟢")
-            icon_label.setStyleSheet(f"""
-                font-size: 48pt;
-            """)
-            icon_label.setAlignment(Qt.AlignCenter)
-            empty_layout.addWidget(icon_label)
-            
-            title_label = QLabel("No vulnerabilities detected")
-            title_label.setStyleSheet(f"""
-                color: {config.COLOR_PRIMARY};
-                font-family: {config.FONT_FAMILY};
-                font-size: {config.FONT_SIZE_TITLE}pt;
-                font-weight: bold;
-            """)
-            title_label.setAlignment(Qt.AlignCenter)
-            empty_layout.addWidget(title_label)
+        # Freeze painting while the summary and cards are swapped in so the
+        # page relayouts once instead of once per inserted widget
+        self.findings_container.setUpdatesEnabled(False)
+        try:
+            self._clear_summary()
             
-            subtitle_label = QLabel("Your cloud environment follows security best practices.")
-            subtitle_label.setStyleSheet(f"""
-                color: {config.COLOR_TEXT}88;
-                font-family: {config.FONT_FAMILY};
-                font-size: {config.FONT_SIZE_NORMAL}pt;
-            """)
-            subtitle_label.setAlignment(Qt.AlignCenter)
-            empty_layout.addWidget(subtitle_label)
+            if not self.findings:
+                self._card_payloads = []
+                self.empty_card.setVisible(True)
+                self.cards_container.setVisible(False)
+                self._hide_cards(0)
+                return
             
-            empty_card.add_layout(empty_layout)
-            self.findings_layout.insertWidget(1, empty_card)
-        else:
-            # Executive Summary Header
-            summary_header = SectionHeader("📊 Executive Summary")
-            self.findings_layout.insertWidget(1, summary_header)
+            self.empty_card.setVisible(False)
             
-            # 4-card grid (2x2)
-            summary_grid = QGridLayout()
-            summary_grid.setSpacing(20)
+            self.summary_section = self.create_summary_section(risk, len(self.findings), len(attacks))
+            self.findings_layout.insertWidget(2, self.summary_section)
             
-            # Row 0: Score | Risk
-            score_card = self.create_score_card(risk)
-            summary_grid.addWidget(score_card, 0, 0)
+            # Index remediation (with lowercased titles) and attacks by cloud once,
+            # keeping the first entry per cloud like a linear scan would.
+            # Either index is skipped entirely when its list is empty.
+            rem_index = {}
+            if remediation:
+                for rem in remediation:
+                    rem_index.setdefault(rem['cloud'], []).append((rem['title'].lower(), rem))
+            attack_index = {}
+            if attacks:
+                for attack in attacks:
+                    attack_index.setdefault(attack['cloud'], attack)
             
-            risk_card = self.create_risk_level_card(risk)
-            summary_grid.addWidget(risk_card, 0, 1)
+            # Match every finding up front; cards are only bound for the first batch
+            payloads = []
+            for finding in self.findings:
+                cloud = finding['cloud']
+                matching_remediation = None
+                if rem_index:
+                    title = finding['title'].lower()
+                    matching_remediation = next(
+                        (rem for rem_title, rem in rem_index.get(cloud, ()) if title in rem_title),
+                        None
+                    )
+                matching_attack = attack_index.get(cloud) if attack_index else None
+                payloads.append((finding, matching_remediation, matching_attack))
+            self._card_payloads = payloads
             
-            # Row 1: Findings | Attack Paths
-            findings_card = self.create_findings_count_card(len(self.findings))
-            summary_grid.addWidget(findings_card, 1, 0)
-            
-            attacks_card = self.create_attacks_count_card(len(attacks))
-            summary_grid.addWidget(attacks_card, 1, 1)
-            
-            self.findings_layout.insertLayout(2, summary_grid)
-            
-            # Risks & Findings section
-            if self.findings:
-                findings_header = SectionHeader("🔍 Risks & Findings")
-                self.findings_layout.insertWidget(3, findings_header)
-                
-                # Create collapsible vulnerability cards
-                insert_index = 4
-                for finding in self.findings:
-                    # Find matching remediation
-                    matching_remediation = None
-                    for rem in remediation:
-                        if finding['cloud'] == rem['cloud'] and finding['title'].lower() in rem['title'].lower():
-                            matching_remediation = rem
-                            break
-                    
-                    # Find matching attack
-                    matching_attack = None
-                    for attack in attacks:
-                        if finding['cloud'] == attack['cloud']:
-                            matching_attack = attack
-                            break
-                    
-                    card = self.create_collapsible_vulnerability_card(finding, matching_remediation, matching_attack)
-                    self.findings_layout.insertWidget(insert_index, card)
-                    insert_index += 1
+            shown = min(len(payloads), _CARD_BATCH)
+            self._show_cards(0, shown)
+            self._hide_cards(shown)
+            self.cards_container.setVisible(True)
+        finally:
+            self.findings_container.setUpdatesEnabled(True)
+            self.findings_container.updateGeometry()
+        
+    def show_empty_state(self, result: dict):
+        """
+        Show the empty report state without rebuilding any cards.
         
-        self.findings_layout.addStretch()
+        Args:
+            result: The clean scan result, kept so it can still be exported
+        """
+        self.current_result = result
+        self._json_bytes = _preserialize_result(result)
+        self._last_result_hash = None
+        self.findings = []
+        self._card_payloads = []
+        self._streaming = False
+        self._clear_summary()
+        self.cards_container.setVisible(False)
+        self._hide_cards(0)
+        self.empty_card.setVisible(True)
+        
+    def is_streaming(self) -> bool:
+        """Whether the cards shown are findings streamed from a running scan."""
+        return self._streaming
+        
+    def append_finding(self, finding: dict):
+        """
+        Add one finding while a scan is still running.
+        
+        The first streamed finding of a scan replaces the previous report;
+        update_findings later rebinds every card with its remediation and attack.
+        
+        Args:
+            finding: Finding dictionary as produced by the cloud scanners
+        """
+        if not self._streaming:
+            self._streaming = True
+            self.current_result = {'findings': []}
+            self._json_bytes = None
+            self._last_result_hash = None
+            self._card_row_height = 0
+            self.findings = self.current_result['findings']
+            self._card_payloads = []
+            self._clear_summary()
+            self._hide_cards(0)
+            self.empty_card.setVisible(False)
+            self.cards_container.setVisible(True)
+        
+        self.findings.append(finding)
+        self._card_payloads.append((finding, None, None))
+        
+        # Findings tend to arrive in bursts; bind whatever arrived during one
+        # event loop pass together instead of relaying out once per finding
+        if not self._append_pending:
+            self._append_pending = True
+            QTimer.singleShot(0, self._flush_appended)
+        
+    def _flush_appended(self):
+        """Bind the findings streamed in since the last pass as one batch."""
+        self._append_pending = False
+        if not self._streaming:
+            # update_findings or show_empty_state already took over
+            return
+        
+        start = self._active_cards
+        end = min(len(self._card_payloads), _CARD_BATCH)
+        self.findings_container.setUpdatesEnabled(False)
+        if start < end:
+            self._show_cards(start, end)
+            self._active_cards = end
+        self._update_cards_stub()
+        self.findings_container.setUpdatesEnabled(True)
+        
+    def _clear_summary(self):
+        """Remove the executive summary of the previous result."""
+        if self.summary_section is not None:
+            self.findings_layout.removeWidget(self.summary_section)
+            self.summary_section.hide()
+            self.summary_section.deleteLater()
+            self.summary_section = None
+        
+    def _show_cards(self, start: int, end: int):
+        """Bind payloads start..end onto pooled cards, creating only the shortfall."""
+        new_cards = []
+        for index in range(start, end):
+            finding, remediation, attack = self._card_payloads[index]
+            if index < len(self._card_pool):
+                card = self._card_pool[index]
+                card.rebind(finding, remediation, attack)
+                card.setVisible(True)
+            else:
+                new_cards.append(self.create_collapsible_vulnerability_card(finding, remediation, attack))
+        
+        # Parent the new cards in one pass once they are fully built
+        for card in new_cards:
+            self._card_pool.append(card)
+            self.cards_layout.insertWidget(self.cards_layout.indexOf(self._cards_stub), card)
+            card.setVisible(True)
+        
+    def _on_scroll(self, value: int = 0):
+        """Bind the next batch of cards once the stub for them scrolls into view."""
+        total = len(self._card_payloads)
+        if self._active_cards >= total or self._cards_stub.visibleRegion().isEmpty():
+            return
+        
+        start = self._active_cards
+        end = min(total, start + _CARD_BATCH)
+        self.findings_container.setUpdatesEnabled(False)
+        self._show_cards(start, end)
+        self._active_cards = end
+        self._update_cards_stub()
+        self.findings_container.setUpdatesEnabled(True)
+        
+        # A long jump can leave the stub in view after one batch; check again
+        # once the new cards have been laid out
+        QTimer.singleShot(0, self._on_scroll)
+        
+    def _hide_cards(self, keep: int):
+        """Hide pooled cards past the first keep; they stay alive for reuse."""
+        for card in self._card_pool[keep:self._active_cards]:
+            card.setVisible(False)
+        self._active_cards = keep
+        self._update_cards_stub()
+        
+    def _update_cards_stub(self):
+        """Size the stub to roughly the height of the cards not bound yet."""
+        remaining = len(self._card_payloads) - self._active_cards
+        if remaining <= 0 or not self._card_pool:
+            self._cards_stub.setVisible(False)
+            return
+        
+        # Collapsed cards share one height, like uniform item sizes in a list
+        # view; measure it once per result from a freshly bound card. Later
+        # measurements could hit a card the user has expanded.
+        if not self._card_row_height:
+            self._card_row_height = self._card_pool[0].sizeHint().height() + self.cards_layout.spacing()
+        self._cards_stub.setFixedHeight(remaining * self._card_row_height)
+        self._cards_stub.setVisible(True)
+        
+    def create_summary_section(self, risk: dict, findings_count: int, attacks_count: int) -> QWidget:
+        """Create the executive summary header and 2x2 card grid."""
+        section = QWidget()
+        section_layout = QVBoxLayout(section)
+        section_layout.setSpacing(32)
+        section_layout.setContentsMargins(0, 0, 0, 0)
+        
+        # Executive Summary Header
+        section_layout.addWidget(SectionHeader("📊 Executive Summary"))
+        
+        # 4-card grid (2x2)
+        summary_grid = QGridLayout()
+        summary_grid.setSpacing(20)
+        
+        # Row 0: Score | Risk
+        score_card = self.create_score_card(risk)
+        summary_grid.addWidget(score_card, 0, 0)
+        
+        risk_card = self.create_risk_level_card(risk)
+        summary_grid.addWidget(risk_card, 0, 1)
+        
+        # Row 1: Findings | Attack Paths
+        findings_card = self.create_findings_count_card(findings_count)
+        summary_grid.addWidget(findings_card, 1, 0)
+        
+        attacks_card = self.create_attacks_count_card(attacks_count)
+        summary_grid.addWidget(attacks_card, 1, 1)
+        
+        section_layout.addLayout(summary_grid)
+        return section
+        
+    def create_empty_card(self) -> CyberCard:
+        """Create the 'no vulnerabilities' card."""
+        empty_card = CyberCard()
+        empty_layout = QVBoxLayout()
+        empty_layout.setAlignment(Qt.AlignCenter)
+        empty_layout.setSpacing(config.SPACING_SM)
+        
+        icon_label = QLabel("🟢")
+        icon_label.setProperty("role", "emptyIcon")
+        icon_label.setAlignment(Qt.AlignCenter)
+        empty_layout.addWidget(icon_label)
+        
+        title_label = QLabel("No vulnerabilities detected")
+        title_label.setProperty("role", "emptyTitle")
+        title_label.setAlignment(Qt.AlignCenter)
+        empty_layout.addWidget(title_label)
+        
+        subtitle_label = QLabel("Your cloud environment follows security best practices.")
+        subtitle_label.setProperty("role", "descDim")
+        subtitle_label.setAlignment(Qt.AlignCenter)
+        empty_layout.addWidget(subtitle_label)
+        
+        empty_card.add_layout(empty_layout)
+        return empty_card
         
     def create_score_card(self, risk: dict) -> CyberCard:
         """Create security score card."""
@@ -199,30 +810,14 @@ class ReportPage(QWidget):
         layout.setSpacing(config.SPACING_SM)
         
         title = QLabel("Security Score")
-        title.setStyleSheet(f"""
-            color: {config.COLOR_TEXT};
-            font-family: {config.FONT_FAMILY};
-            font-size: {config.FONT_SIZE_NORMAL}pt;
-            font-weight: bold;
-        """)
+        title.setProperty("role", "titleBold")
         layout.addWidget(title)
         
         security_score = risk.get('security_score', 0)
         score_label = QLabel(f"{security_score}/100")
         
-        if security_score >= 80:
-            score_color = config.COLOR_PRIMARY
-        elif security_score >= 60:
-            score_color = config.COLOR_WARNING
-        else:
-            score_color = config.COLOR_CRITICAL
-        
-        score_label.setStyleSheet(f"""
-            color: {score_color};
-            font-family: {config.FONT_FAMILY};
-            font-size: 32pt;
-            font-weight: bold;
-        """)
+        variant = _score_variant(security_score)
+        score_label.setObjectName(f"scoreValue{variant}")
         layout.addWidget(score_label)
         
         # Progress bar
@@ -231,26 +826,12 @@ class ReportPage(QWidget):
         progress.setMaximumHeight(8)
         progress.setValue(security_score)
         progress.setTextVisible(False)
-        progress.setStyleSheet(f"""
-            QProgressBar {{
-                border: none;
-                border-radius: 4px;
-                background-color: {config.COLOR_BACKGROUND};
-            }}
-            QProgressBar::chunk {{
-                background-color: {score_color};
-                border-radius: 4px;
-            }}
-        """)
+        progress.setObjectName(f"scoreBar{variant}")
         layout.addWidget(progress)
         
         risk_level = risk.get('risk_level', 'Unknown')
         risk_label = QLabel(f"Risk: {risk_level}")
-        risk_label.setStyleSheet(f"""
-            color: {config.COLOR_TEXT}88;
-            font-family: {config.FONT_FAMILY};
-            font-size: {config.FONT_SIZE_NORMAL}pt;
-        """)
+        risk_label.setProperty("role", "descDim")
         layout.addWidget(risk_label)
         
         card.add_layout(layout)
@@ -263,40 +844,19 @@ class ReportPage(QWidget):
         layout.setSpacing(config.SPACING_SM)
         
         title = QLabel("Risk Level")
-        title.setStyleSheet(f"""
-            color: {config.COLOR_TEXT};
-            font-family: {config.FONT_FAMILY};
-            font-size: {config.FONT_SIZE_NORMAL}pt;
-            font-weight: bold;
-        """)
+        title.setProperty("role", "titleBold")
         layout.addWidget(title)
         
         risk_level = risk.get('risk_level', 'Unknown').upper()
         
-        if risk_level == 'CRITICAL':
-            level_color = config.COLOR_CRITICAL
-        elif risk_level == 'HIGH':
-            level_color = config.COLOR_CRITICAL
-        elif risk_level == 'MEDIUM':
-            level_color = config.COLOR_WARNING
-        else:
-            level_color = config.COLOR_PRIMARY
+        variant = _LEVEL_VARIANTS.get(risk_level, "Ok")
         
         level_label = QLabel(risk_level)
-        level_label.setStyleSheet(f"""
-            color: {level_color};
-            font-family: {config.FONT_FAMILY};
-            font-size: 24pt;
-            font-weight: bold;
-        """)
+        level_label.setObjectName(f"levelValue{variant}")
         layout.addWidget(level_label)
         
         desc = QLabel("Current security posture")
-        desc.setStyleSheet(f"""
-            color: {config.COLOR_TEXT}88;
-            font-family: {config.FONT_FAMILY};
-            font-size: {config.FONT_SIZE_NORMAL}pt;
-        """)
+        desc.setProperty("role", "descDim")
         layout.addWidget(desc)
         
         card.add_layout(layout)
@@ -309,29 +869,15 @@ class ReportPage(QWidget):
         layout.setSpacing(config.SPACING_SM)
         
         title = QLabel("Total Findings")
-        title.setStyleSheet(f"""
-            color: {config.COLOR_TEXT};
-            font-family: {config.FONT_FAMILY};
-            font-size: {config.FONT_SIZE_NORMAL}pt;
-            font-weight: bold;
-        """)
+        title.setProperty("role", "titleBold")
         layout.addWidget(title)
         
         count_label = QLabel(str(count))
-        count_label.setStyleSheet(f"""
-            color: {config.COLOR_ACCENT};
-            font-family: {config.FONT_FAMILY};
-            font-size: 32pt;
-            font-weight: bold;
-        """)
+        count_label.setProperty("role", "countAccent")
         layout.addWidget(count_label)
         
         desc = QLabel("Security issues detected")
-        desc.setStyleSheet(f"""
-            color: {config.COLOR_TEXT}88;
-            font-family: {config.FONT_FAMILY};
-            font-size: {config.FONT_SIZE_NORMAL}pt;
-        """)
+        desc.setProperty("role", "descDim")
         layout.addWidget(desc)
         
         card.add_layout(layout)
@@ -344,29 +890,15 @@ class ReportPage(QWidget):
         layout.setSpacing(config.SPACING_SM)
         
         title = QLabel("Attack Paths Found")
-        title.setStyleSheet(f"""
-            color: {config.COLOR_TEXT};
-            font-family: {config.FONT_FAMILY};
-            font-size: {config.FONT_SIZE_NORMAL}pt;
-            font-weight: bold;
-        """)
+        title.setProperty("role", "titleBold")
         layout.addWidget(title)
         
         count_label = QLabel(str(count))
-        count_label.setStyleSheet(f"""
-            color: {config.COLOR_CRITICAL};
-            font-family: {config.FONT_FAMILY};
-            font-size: 32pt;
-            font-weight: bold;
-        """)
+        count_label.setProperty("role", "countCrit")
         layout.addWidget(count_label)
         
         desc = QLabel("Potential attack vectors")
-        desc.setStyleSheet(f"""
-            color: {config.COLOR_TEXT}88;
-            font-family: {config.FONT_FAMILY};
-            font-size: {config.FONT_SIZE_NORMAL}pt;
-        """)
+        desc.setProperty("role", "descDim")
         layout.addWidget(desc)
         
         card.add_layout(layout)
@@ -374,222 +906,22 @@ class ReportPage(QWidget):
     
     def create_collapsible_vulnerability_card(self, finding: dict, remediation: dict = None, attack: dict = None) -> CyberCard:
         """Create collapsible vulnerability card."""
-        card = CyberCard()
-        main_layout = QVBoxLayout()
-        main_layout.setSpacing(12)
-        
-        # Collapsed header (always visible)
-        header_layout = QHBoxLayout()
-        
-        title_label = QLabel(finding["title"])
-        title_label.setStyleSheet(f"""
-            color: {config.COLOR_TEXT};
-            font-family: {config.FONT_FAMILY};
-            font-size: {config.FONT_SIZE_HEADER}pt;
-            font-weight: bold;
-        """)
-        header_layout.addWidget(title_label)
-        header_layout.addStretch()
-        
-        severity_badge = StatusBadge(finding["severity"], finding["severity"].lower())
-        header_layout.addWidget(severity_badge)
-        
-        cloud_badge = StatusBadge(finding["cloud"], "info")
-        header_layout.addWidget(cloud_badge)
-        
-        main_layout.addLayout(header_layout)
-        
-        # Short description (always visible)
-        short_desc = finding["description"][:100] + "..." if len(finding["description"]) > 100 else finding["description"]
-        desc_label = QLabel(short_desc)
-        desc_label.setWordWrap(True)
-        desc_label.setStyleSheet(f"""
-            color: {config.COLOR_TEXT}cc;
-            font-family: {config.FONT_FAMILY};
-            font-size: {config.FONT_SIZE_NORMAL}pt;
-        """)
-        main_layout.addWidget(desc_label)
-        
-        # Expandable details container
-        details_widget = QWidget()
-        details_layout = QVBoxLayout(details_widget)
-        details_layout.setContentsMargins(0, 12, 0, 0)
-        details_layout.setSpacing(12)
-        details_widget.setVisible(False)
-        
-        # Full description
-        if len(finding["description"]) > 100:
-            full_desc = QLabel(finding["description"])
-            full_desc.setWordWrap(True)
-            full_desc.setStyleSheet(f"""
-                color: {config.COLOR_TEXT};
-                font-family: {config.FONT_FAMILY};
-                font-size: {config.FONT_SIZE_NORMAL}pt;
-            """)
-            details_layout.addWidget(full_desc)
-        
-        # Attack Path subsection
-        if attack:
-            attack_header = QLabel("Attack Path")
-            attack_header.setStyleSheet(f"""
-                color: {config.COLOR_TEXT};
-                font-family: {config.FONT_FAMILY};
-                font-size: {config.FONT_SIZE_NORMAL}pt;
-                font-weight: bold;
-                margin-top: 8px;
-            """)
-            details_layout.addWidget(attack_header)
-            
-            attack_label = QLabel(attack['title'])
-            attack_label.setWordWrap(True)
-            attack_label.setStyleSheet(f"""
-                color: {config.COLOR_ACCENT};
-                font-family: {config.FONT_FAMILY};
-                font-size: {config.FONT_SIZE_NORMAL}pt;
-                padding-left: {config.SPACING_MD}px;
-            """)
-            details_layout.addWidget(attack_label)
-        
-        # Remediation subsections
-        if remediation:
-            # CLI Fix
-            cli_header = QLabel("CLI Fix")
-            cli_header.setStyleSheet(f"""
-                color: {config.COLOR_TEXT};
-                font-family: {config.FONT_FAMILY};
-                font-size: {config.FONT_SIZE_NORMAL}pt;
-                font-weight: bold;
-                margin-top: 8px;
-            """)
-            details_layout.addWidget(cli_header)
-            
-            cli_text = QTextEdit()
-            cli_text.setPlainText(remediation.get("cli_script", ""))
-            cli_text.setReadOnly(True)
-            cli_text.setMaximumHeight(80)
-            cli_text.setStyleSheet(f"""
-                QTextEdit {{
-                    background-color: {config.COLOR_BACKGROUND};
-                    color: {config.COLOR_PRIMARY};
-                    border: 1px solid {config.COLOR_BORDER};
-                    border-radius: 4px;
-                    padding: {config.SPACING_SM}px;
-                    font-family: {config.FONT_FAMILY};
-                    font-size: 9pt;
-                }}
-            """)
-            details_layout.addWidget(cli_text)
-            
-            cli_copy_btn = QPushButton("📋 Copy CLI")
-            cli_copy_btn.clicked.connect(lambda: self.copy_to_clipboard(remediation.get("cli_script", "")))
-            cli_copy_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {config.COLOR_CARD};
-                    color: {config.COLOR_PRIMARY};
-                    border: 1px solid {config.COLOR_PRIMARY};
-                    border-radius: 4px;
-                    padding: {config.SPACING_XS}px {config.SPACING_MD}px;
-                    font-family: {config.FONT_FAMILY};
-                    font-size: 9pt;
-                }}
-                QPushButton:hover {{
-                    background-color: {config.COLOR_PRIMARY}22;
-                }}
-            """)
-            details_layout.addWidget(cli_copy_btn, alignment=Qt.AlignLeft)
-            
-            # Terraform Fix
-            tf_header = QLabel("Terraform Fix")
-            tf_header.setStyleSheet(f"""
-                color: {config.COLOR_TEXT};
-                font-family: {config.FONT_FAMILY};
-                font-size: {config.FONT_SIZE_NORMAL}pt;
-                font-weight: bold;
-                margin-top: 8px;
-            """)
-            details_layout.addWidget(tf_header)
-            
-            tf_text = QTextEdit()
-            tf_text.setPlainText(remediation.get("terraform", ""))
-            tf_text.setReadOnly(True)
-            tf_text.setMaximumHeight(80)
-            tf_text.setStyleSheet(f"""
-                QTextEdit {{
-                    background-color: {config.COLOR_BACKGROUND};
-                    color: {config.COLOR_ACCENT};
-                    border: 1px solid {config.COLOR_BORDER};
-                    border-radius: 4px;
-                    padding: {config.SPACING_SM}px;
-                    font-family: {config.FONT_FAMILY};
-                    font-size: 9pt;
-                }}
-            """)
-            details_layout.addWidget(tf_text)
-            
-            tf_copy_btn = QPushButton("📋 Copy Terraform")
-            tf_copy_btn.clicked.connect(lambda: self.copy_to_clipboard(remediation.get("terraform", "")))
-            tf_copy_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {config.COLOR_CARD};
-                    color: {config.COLOR_ACCENT};
-                    border: 1px solid {config.COLOR_ACCENT};
-                    border-radius: 4px;
-                    padding: {config.SPACING_XS}px {config.SPACING_MD}px;
-                    font-family: {config.FONT_FAMILY};
-                    font-size: 9pt;
-                }}
-                QPushButton:hover {{
-                    background-color: {config.COLOR_ACCENT}22;
-                }}
-            """)
-            details_layout.addWidget(tf_copy_btn, alignment=Qt.AlignLeft)
-        
-        main_layout.addWidget(details_widget)
-        
-        # Toggle button
-        toggle_btn = QPushButton("View Details ▼")
-        toggle_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {config.COLOR_PRIMARY};
-                border: none;
-                text-align: left;
-                padding: {config.SPACING_XS}px 0px;
-                font-family: {config.FONT_FAMILY};
-                font-size: {config.FONT_SIZE_NORMAL}pt;
-            }}
-            QPushButton:hover {{
-                color: {config.COLOR_PRIMARY}cc;
-            }}
-        """)
-        
-        def toggle_details():
-            is_visible = details_widget.isVisible()
-            details_widget.setVisible(not is_visible)
-            toggle_btn.setText("Hide Details ▲" if not is_visible else "View Details ▼")
-        
-        toggle_btn.clicked.connect(toggle_details)
-        main_layout.addWidget(toggle_btn)
-        
-        card.add_layout(main_layout)
+        # Hand the card the clipboard setter itself rather than a bound method
+        # of this page, so pooled cards keep no reference back to the page
+        card = _CollapsibleCard(self._clipboard.setText)
+        card.rebind(finding, remediation, attack)
         return card
     
     def copy_to_clipboard(self, text: str):
         """Copy text to system clipboard."""
-        clipboard = QApplication.clipboard()
-        clipboard.setText(text)
+        self._clipboard.setText(text)
 
     def export_json(self):
         """Export report as JSON."""
         if not self.current_result:
-            from components.toast import show_toast
             show_toast(self, "No scan results to export. Run a scan first.")
             return
         
-        from PySide6.QtWidgets import QFileDialog
-        from datetime import datetime
-        import json
-        
         default_name = f"cloudstrike_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         file_path, _ = QFileDialog.getSaveFileName(
             self,
@@ -599,26 +931,22 @@ class ReportPage(QWidget):
         )
         
         if file_path:
-            try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(self.current_result, f, indent=4)
-                
-                from components.toast import show_toast
-                show_toast(self, f"Report saved: {file_path}")
-            except Exception as e:
-                from components.toast import show_toast
-                show_toast(self, f"Export failed: {str(e)}")
+            self.export_json_btn.setEnabled(False)
+            self._json_worker = JsonExportWorker(self.current_result, file_path, self._json_bytes)
+            self._json_worker.finished_signal.connect(self.on_json_exported)
+            self._json_worker.start()
+    
+    def on_json_exported(self, file_path: str, error: str):
+        """Report the outcome of a background JSON export."""
+        self.export_json_btn.setEnabled(True)
+        show_toast(self, error or f"Report saved: {file_path}")
     
     def export_pdf(self):
         """Export report as PDF."""
         if not self.current_result:
-            from components.toast import show_toast
             show_toast(self, "No scan results to export. Run a scan first.")
             return
         
-        from PySide6.QtWidgets import QFileDialog
-        from datetime import datetime
-        
         default_name = f"cloudstrike_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
         file_path, _ = QFileDialog.getSaveFileName(
             self,
@@ -628,67 +956,12 @@ class ReportPage(QWidget):
         )
         
         if file_path:
-            try:
-                from reportlab.lib.pagesizes import letter
-                from reportlab.lib import colors
-                from reportlab.lib.styles import getSampleStyleSheet
-                from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-                from reportlab.lib.units import inch
-                
-                doc = SimpleDocTemplate(file_path, pagesize=letter)
-                story = []
-                styles = getSampleStyleSheet()
-                
-                # Title
-                title = Paragraph("<b>CloudStrike Security Report</b>", styles['Title'])
-                story.append(title)
-                story.append(Spacer(1, 0.2*inch))
-                
-                # Timestamp
-                timestamp = Paragraph(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", styles['Normal'])
-                story.append(timestamp)
-                story.append(Spacer(1, 0.3*inch))
-                
-                # Risk Summary
-                risk = self.current_result.get('risk', {})
-                summary_data = [
-                    ['Security Score', str(risk.get('security_score', 0))],
-                    ['Risk Level', risk.get('risk_level', 'Unknown')],
-                    ['Total Findings', str(len(self.current_result.get('findings', [])))],
-                    ['Attack Paths', str(len(self.current_result.get('attacks', [])))]  
-                ]
-                
-                summary_table = Table(summary_data, colWidths=[3*inch, 2*inch])
-                summary_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, -1), colors.lightgrey),
-                    ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 12),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black)
-                ]))
-                
-                story.append(summary_table)
-                story.append(Spacer(1, 0.3*inch))
-                
-                # Findings
-                story.append(Paragraph("<b>Security Findings</b>", styles['Heading2']))
-                story.append(Spacer(1, 0.1*inch))
-                
-                for finding in self.current_result.get('findings', [])[:10]:
-                    finding_text = f"<b>{finding['title']}</b> [{finding['severity']}]<br/>{finding['description']}"
-                    story.append(Paragraph(finding_text, styles['Normal']))
-                    story.append(Spacer(1, 0.1*inch))
-                
-                doc.build(story)
-                
-                from components.toast import show_toast
-                show_toast(self, f"PDF saved: {file_path}")
-                
-            except ImportError:
-                from components.toast import show_toast
-                show_toast(self, "PDF export requires reportlab. Install: pip install reportlab")
-            except Exception as e:
-                from components.toast import show_toast
-                show_toast(self, f"Export failed: {str(e)}")
+            self.export_pdf_btn.setEnabled(False)
+            self._pdf_worker = PdfExportWorker(self.current_result, file_path)
+            self._pdf_worker.finished_signal.connect(self.on_pdf_exported)
+            self._pdf_worker.start()
+    
+    def on_pdf_exported(self, file_path: str, error: str):
+        """Report the outcome of a background PDF export."""
+        self.export_pdf_btn.setEnabled(True)
+        show_toast(self, error or f"PDF saved: {file_path}")
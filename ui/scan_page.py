@@ -1,126 +1,288 @@
 """Scan execution page."""
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QTextEdit, QProgressBar, QLabel
-from PySide6.QtCore import Qt, QThread, Signal
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QPlainTextEdit, QProgressBar, QLabel
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, Signal
 from PySide6.QtGui import QTextCursor
 import logging
+import threading
+import time
 import config
 from components.section_header import SectionHeader
 from components.glow_button import GlowButton
-from core.scanner import run_cloud_scan
+from core.scanner import run_cloud_scan, no_credentials_result
 
 logger = logging.getLogger(__name__)
 
+# Log lines are sent to the page in batches: once this many are buffered,
+# or once this many seconds have passed since the last batch
+_LOG_BATCH_LINES = 8
+_LOG_FLUSH_INTERVAL = 0.05
 
-class ScanWorker(QThread):
-    """Background worker for running scans."""
+# Progress updates are applied at most once per this many milliseconds;
+# only the latest update in each interval is shown
+_PROGRESS_FLUSH_MS = 50
+
+# Oldest terminal lines are dropped past this many
+_TERMINAL_MAX_LINES = 2000
+
+# Stylesheets, formatted once at import
+_PROGRESS_LABEL_QSS = f"""
+    color: {config.COLOR_PRIMARY};
+    font-family: {config.FONT_FAMILY};
+    font-size: {config.FONT_SIZE_NORMAL}pt;
+    font-weight: bold;
+"""
+_PROGRESS_BAR_QSS = f"""
+    QProgressBar {{
+        border: 1px solid {config.COLOR_BORDER};
+        border-radius: 4px;
+        background-color: {config.COLOR_BACKGROUND};
+        text-align: center;
+        color: {config.COLOR_TEXT};
+        font-family: {config.FONT_FAMILY};
+        height: 24px;
+    }}
+    QProgressBar::chunk {{
+        background-color: {config.COLOR_PRIMARY};
+        border-radius: 3px;
+    }}
+"""
+_TERMINAL_QSS = f"""
+    QPlainTextEdit {{
+        background-color: {config.COLOR_BACKGROUND};
+        color: {config.COLOR_PRIMARY};
+        border: 1px solid {config.COLOR_BORDER};
+        border-radius: 4px;
+        padding: {config.SPACING_SM}px;
+        font-family: {config.FONT_FAMILY};
+        font-size: {config.FONT_SIZE_NORMAL}pt;
+    }}
+"""
+
+
+# Scan narration as (message, demo mode delay in seconds) steps
+_CRED_STEPS = (
+    ("========== CREDENTIAL VALIDATION ==========", 0.2),
+    ("[•] Loading saved credentials...", 0.3),
+    ("[✓] Credentials loaded successfully", 0.2),
+    ("[•] Establishing secure cloud connections...", 0.4),
+)
+_AWS_STEPS = (
+    ("========== AWS SECURITY SCAN ==========", 0.2),
+    ("[•] Enumerating S3 buckets...", 0.5),
+    ("[•] Checking bucket public access policies...", 0.4),
+    ("[✓] S3 scan completed", 0.3),
+    ("[•] Enumerating IAM roles...", 0.5),
+    ("[•] Analyzing role permissions...", 0.4),
+    ("[✓] IAM scan completed", 0.3),
+    ("[•] Checking CloudTrail logging...", 0.4),
+    ("[✓] Logging configuration analyzed", 0.3),
+    ("", 0.2),
+)
+_AZURE_STEPS = (
+    ("========== AZURE SECURITY SCAN ==========", 0.2),
+    ("[•] Enumerating storage accounts...", 0.5),
+    ("[•] Checking public blob access...", 0.4),
+    ("[✓] Storage security analyzed", 0.3),
+    ("[•] Verifying HTTPS enforcement...", 0.4),
+    ("[✓] Network security analyzed", 0.3),
+    ("", 0.2),
+)
+_GCP_STEPS = (
+    ("========== GCP SECURITY SCAN ==========", 0.2),
+    ("[•] Enumerating GCS buckets...", 0.5),
+    ("[•] Inspecting IAM policies...", 0.4),
+    ("[✓] Storage security analyzed", 0.3),
+    ("[•] Checking bucket versioning...", 0.4),
+    ("[✓] Data protection analyzed", 0.3),
+    ("", 0.2),
+)
+_ATTACK_STEPS = (
+    ("========== ATTACK SIMULATION ==========", 0.2),
+    ("[•] Building attack graph...", 0.5),
+    ("[•] Mapping privilege escalation paths...", 0.4),
+    ("[•] Simulating data exfiltration scenarios...", 0.4),
+    ("[✓] Attack paths generated successfully", 0.3),
+)
+_RISK_STEPS = (
+    ("========== RISK ANALYSIS ==========", 0.2),
+    ("[•] Calculating security posture score...", 0.4),
+    ("[•] Prioritizing critical risks...", 0.4),
+    ("[✓] Risk analysis complete", 0.3),
+)
+_REMED_STEPS = (
+    ("========== REMEDIATION GENERATION ==========", 0.2),
+    ("[•] Generating CLI remediation scripts...", 0.4),
+    ("[•] Generating Terraform snippets...", 0.4),
+    ("[✓] Remediation guidance ready", 0.3),
+)
+
+# (credentials key, field that marks it configured, display name, narration)
+# for each provider, in narration order
+_PROVIDERS = (
+    ("aws", "access_key", "AWS", _AWS_STEPS),
+    ("azure", "tenant_id", "Azure", _AZURE_STEPS),
+    ("gcp", "project_id", "GCP", _GCP_STEPS),
+)
+
+
+def _has(credentials: dict, provider: str, key: str) -> bool:
+    """Whether credentials hold a non-empty key for provider."""
+    section = credentials.get(provider)
+    return bool(section and section.get(key))
+
+
+class ScanSignals(QObject):
+    """Signals of a ScanWorker; a QRunnable cannot carry signals itself."""
     
-    log_signal = Signal(str)
+    log_signal = Signal(str)  # one or more newline-separated log lines
     progress_signal = Signal(int, str)
     finished_signal = Signal(dict)
+
+
+class ScanWorker(QRunnable):
+    """Background worker for running scans on the global thread pool."""
     
-    def __init__(self, credentials):
-        """Initialize worker with credentials."""
+    def __init__(self, credentials=None):
+        """Initialize worker with credentials; they can be replaced between scans."""
         super().__init__()
-        self.credentials = credentials
+        # The page keeps the worker and resubmits it for every scan, so the
+        # pool must not delete it after run()
+        self.setAutoDelete(False)
+        self.signals = ScanSignals()
+        self.credentials = credentials or {}
+        # Set by cancel(); also wakes up a demo mode pause early
+        self._cancel = threading.Event()
+        # Set from reset() until run() returns; finished_signal goes out
+        # before that, so the page checks this before resubmitting
+        self._running = threading.Event()
+        self._log_buffer = []
+        self._last_flush = time.monotonic()
     
     def log_step(self, message: str, delay: float = 0.4):
-        """Emit log message with realistic delay."""
-        import time
-        from datetime import datetime
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_signal.emit(f"[{timestamp}] {message}")
-        time.sleep(delay)
+        """Queue a log message, pausing for delay seconds only in demo mode."""
+        now = time.localtime()
+        self._log_buffer.append(f"[{now.tm_hour:02d}:{now.tm_min:02d}:{now.tm_sec:02d}] {message}")
+        if (len(self._log_buffer) >= _LOG_BATCH_LINES
+                or time.monotonic() - self._last_flush > _LOG_FLUSH_INTERVAL):
+            self.flush_logs()
+        if config.DEMO_MODE:
+            # Show the line before pausing on it; cancel() cuts the pause short
+            self.flush_logs()
+            self._cancel.wait(delay)
+    
+    def flush_logs(self):
+        """Emit the buffered log lines as a single block."""
+        if self._log_buffer:
+            self.signals.log_signal.emit("\n".join(self._log_buffer))
+            self._log_buffer.clear()
+        self._last_flush = time.monotonic()
+    
+    def report_progress(self, value: int, status: str):
+        """Show the buffered log lines, then move the progress bar on."""
+        self.flush_logs()
+        self.signals.progress_signal.emit(value, status)
+    
+    def reset(self, credentials: dict):
+        """Prepare the worker for another scan with the given credentials."""
+        self.credentials = credentials
+        self._cancel.clear()
+        self._running.set()
+    
+    def is_running(self) -> bool:
+        """Whether a scan was submitted and run() has not returned yet."""
+        return self._running.is_set()
+    
+    def cancel(self):
+        """Ask a running scan to stop at the next stage boundary."""
+        self._cancel.set()
+    
+    def _stop_if_cancelled(self) -> bool:
+        """Report the scan as cancelled if cancel() was called; True if so."""
+        if not self._cancel.is_set():
+            return False
+        self.log_step("[!] Scan cancelled", 0)
+        self.flush_logs()
+        self.signals.finished_signal.emit({"findings": [], "attacks": [], "cancelled": True})
+        return True
+    
+    def log_steps(self, steps):
+        """Log a table of (message, delay) narration steps."""
+        for message, delay in steps:
+            self.log_step(message, delay)
     
     def run(self):
         """Execute scan in background thread."""
+        try:
+            self._run_scan()
+        finally:
+            self._running.clear()
+    
+    def _run_scan(self):
+        """Run the scan stages, narrating each and reporting the result."""
         # STAGE 1: CREDENTIAL VALIDATION
-        self.log_step("========== CREDENTIAL VALIDATION ==========", 0.2)
-        self.log_step("[•] Loading saved credentials...", 0.3)
-        self.log_step("[✓] Credentials loaded successfully", 0.2)
-        self.log_step("[•] Establishing secure cloud connections...", 0.4)
-        
-        has_aws = bool(self.credentials.get('aws', {}).get('access_key'))
-        has_azure = bool(self.credentials.get('azure', {}).get('tenant_id'))
-        has_gcp = bool(self.credentials.get('gcp', {}).get('project_id'))
-        
-        if has_aws:
-            self.log_step("[✓] AWS authentication successful", 0.3)
-        if has_azure:
-            self.log_step("[✓] Azure authentication successful", 0.3)
-        if has_gcp:
-            self.log_step("[✓] GCP authentication successful", 0.3)
-        
-        self.progress_signal.emit(10, "Credential validation complete")
+        self.log_steps(_CRED_STEPS)
+        
+        active = [
+            (label, steps) for provider, key, label, steps in _PROVIDERS
+            if _has(self.credentials, provider, key)
+        ]
+        
+        for label, _ in active:
+            self.log_step(f"[✓] {label} authentication successful", 0.3)
+        
+        # Nothing to scan: skip the remaining stages and report it right away
+        if not active:
+            self.log_step("[!] No cloud credentials configured", 0.2)
+            self.report_progress(100, "No credentials configured")
+            self.signals.finished_signal.emit(no_credentials_result())
+            return
+        
+        self.report_progress(10, "Credential validation complete")
         self.log_step("", 0.2)
+        if self._stop_if_cancelled():
+            return
         
         # STAGE 2: CLOUD MISCONFIGURATION SCAN
-        if has_aws:
-            self.log_step("========== AWS SECURITY SCAN ==========", 0.2)
-            self.log_step("[•] Enumerating S3 buckets...", 0.5)
-            self.log_step("[•] Checking bucket public access policies...", 0.4)
-            self.log_step("[✓] S3 scan completed", 0.3)
-            self.log_step("[•] Enumerating IAM roles...", 0.5)
-            self.log_step("[•] Analyzing role permissions...", 0.4)
-            self.log_step("[✓] IAM scan completed", 0.3)
-            self.log_step("[•] Checking CloudTrail logging...", 0.4)
-            self.log_step("[✓] Logging configuration analyzed", 0.3)
-            self.log_step("", 0.2)
-        
-        if has_azure:
-            self.log_step("========== AZURE SECURITY SCAN ==========", 0.2)
-            self.log_step("[•] Enumerating storage accounts...", 0.5)
-            self.log_step("[•] Checking public blob access...", 0.4)
-            self.log_step("[✓] Storage security analyzed", 0.3)
-            self.log_step("[•] Verifying HTTPS enforcement...", 0.4)
-            self.log_step("[✓] Network security analyzed", 0.3)
-            self.log_step("", 0.2)
-        
-        if has_gcp:
-            self.log_step("========== GCP SECURITY SCAN ==========", 0.2)
-            self.log_step("[•] Enumerating GCS buckets...", 0.5)
-            self.log_step("[•] Inspecting IAM policies...", 0.4)
-            self.log_step("[✓] Storage security analyzed", 0.3)
-            self.log_step("[•] Checking bucket versioning...", 0.4)
-            self.log_step("[✓] Data protection analyzed", 0.3)
-            self.log_step("", 0.2)
-        
-        self.progress_signal.emit(60, "Cloud scanning complete")
-        
-        # Run actual scan
+        for _, steps in active:
+            self.log_steps(steps)
+        
+        self.report_progress(60, "Cloud scanning complete")
+        if self._stop_if_cancelled():
+            return
+        
+        # Run actual scan; it blocks, so show everything logged so far first
+        self.flush_logs()
         result = run_cloud_scan(self.credentials)
+        if self._stop_if_cancelled():
+            return
         
         # STAGE 3: ATTACK SIMULATION
-        self.log_step("========== ATTACK SIMULATION ==========", 0.2)
-        self.log_step("[•] Building attack graph...", 0.5)
-        self.log_step("[•] Mapping privilege escalation paths...", 0.4)
-        self.log_step("[•] Simulating data exfiltration scenarios...", 0.4)
-        self.log_step("[✓] Attack paths generated successfully", 0.3)
-        self.progress_signal.emit(80, "Attack simulation complete")
+        self.log_steps(_ATTACK_STEPS)
+        self.report_progress(80, "Attack simulation complete")
         self.log_step("", 0.2)
+        if self._stop_if_cancelled():
+            return
         
         # STAGE 4: RISK ANALYSIS
-        self.log_step("========== RISK ANALYSIS ==========", 0.2)
-        self.log_step("[•] Calculating security posture score...", 0.4)
-        self.log_step("[•] Prioritizing critical risks...", 0.4)
-        self.log_step("[✓] Risk analysis complete", 0.3)
-        self.progress_signal.emit(90, "Risk analysis complete")
+        self.log_steps(_RISK_STEPS)
+        self.report_progress(90, "Risk analysis complete")
         self.log_step("", 0.2)
+        if self._stop_if_cancelled():
+            return
         
         # STAGE 5: REMEDIATION GENERATION
-        self.log_step("========== REMEDIATION GENERATION ==========", 0.2)
-        self.log_step("[•] Generating CLI remediation scripts...", 0.4)
-        self.log_step("[•] Generating Terraform snippets...", 0.4)
-        self.log_step("[✓] Remediation guidance ready", 0.3)
-        self.progress_signal.emit(100, "Scan complete")
+        self.log_steps(_REMED_STEPS)
+        self.report_progress(100, "Scan complete")
         self.log_step("", 0.2)
         
-        findings_count = len(result.get('findings', []))
-        attacks_count = len(result.get('attacks', []))
+        findings_count = len(result.get('findings') or ())
+        attacks_count = len(result.get('attacks') or ())
         
         self.log_step("🎉 Cloud security scan completed successfully!", 0.1)
         self.log_step(f"[+] Found {findings_count} security issues", 0.1)
         self.log_step(f"[+] Generated {attacks_count} attack simulations", 0.1)
-        self.finished_signal.emit(result)
+        self.flush_logs()
+        self.signals.finished_signal.emit(result)
 
 
 class ScanPage(QWidget):
@@ -132,14 +294,40 @@ class ScanPage(QWidget):
     def __init__(self, parent=None):
         """Initialize scan page."""
         super().__init__(parent)
-        self.worker = None
         self.credentials_callback = None
-        self.setup_ui()
+        self.worker = self._create_worker()
+        self._pending_progress = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(_PROGRESS_FLUSH_MS)
+        self._progress_timer.timeout.connect(self._flush_progress)
+        # Widgets are built on first show (or first scan), not at startup
+        self._ui_built = False
     
     def set_credentials_callback(self, callback):
         """Set callback function to retrieve credentials."""
         self.credentials_callback = callback
         
+    def _create_worker(self) -> ScanWorker:
+        """Create a scan worker wired to this page."""
+        worker = ScanWorker()
+        # The signals are always emitted from a pool thread, so these would
+        # resolve to queued connections anyway; say so up front
+        worker.signals.log_signal.connect(self.append_log, Qt.QueuedConnection)
+        worker.signals.progress_signal.connect(self.update_progress, Qt.QueuedConnection)
+        worker.signals.finished_signal.connect(self.on_scan_complete, Qt.QueuedConnection)
+        return worker
+    
+    def showEvent(self, event):
+        """Build the widgets the first time the page is shown."""
+        self._ensure_ui()
+        super().showEvent(event)
+    
+    def _ensure_ui(self):
+        """Run setup_ui once, before anything touches the widgets."""
+        if not self._ui_built:
+            self._ui_built = True
+            self.setup_ui()
+        
     def setup_ui(self):
         """Setup scan UI."""
         layout = QVBoxLayout(self)
@@ -158,53 +346,33 @@ class ScanPage(QWidget):
         self.scan_btn.clicked.connect(self.start_scan)
         layout.addWidget(self.scan_btn, alignment=Qt.AlignCenter)
         
+        self.cancel_btn = GlowButton("■ Cancel Scan", primary=False)
+        self.cancel_btn.setEnabled(False)
+        self.cancel_btn.clicked.connect(self.cancel_scan)
+        layout.addWidget(self.cancel_btn, alignment=Qt.AlignCenter)
+        
         # Progress section
         self.progress_label = QLabel("Ready to scan")
-        self.progress_label.setStyleSheet(f"""
-            color: {config.COLOR_PRIMARY};
-            font-family: {config.FONT_FAMILY};
-            font-size: {config.FONT_SIZE_NORMAL}pt;
-            font-weight: bold;
-        """)
+        self.progress_label.setStyleSheet(_PROGRESS_LABEL_QSS)
         layout.addWidget(self.progress_label)
         
         self.progress_bar = QProgressBar()
-        self.progress_bar.setStyleSheet(f"""
-            QProgressBar {{
-                border: 1px solid {config.COLOR_BORDER};
-                border-radius: 4px;
-                background-color: {config.COLOR_BACKGROUND};
-                text-align: center;
-                color: {config.COLOR_TEXT};
-                font-family: {config.FONT_FAMILY};
-                height: 24px;
-            }}
-            QProgressBar::chunk {{
-                background-color: {config.COLOR_PRIMARY};
-                border-radius: 3px;
-            }}
-        """)
+        self.progress_bar.setStyleSheet(_PROGRESS_BAR_QSS)
         self.progress_bar.setValue(0)
         layout.addWidget(self.progress_bar)
         
-        self.terminal = QTextEdit()
+        # Plain text terminal: appends stay cheap as the log grows, and the
+        # oldest lines are dropped past the cap
+        self.terminal = QPlainTextEdit()
         self.terminal.setReadOnly(True)
-        self.terminal.setStyleSheet(f"""
-            QTextEdit {{
-                background-color: {config.COLOR_BACKGROUND};
-                color: {config.COLOR_PRIMARY};
-                border: 1px solid {config.COLOR_BORDER};
-                border-radius: 4px;
-                padding: {config.SPACING_SM}px;
-                font-family: {config.FONT_FAMILY};
-                font-size: {config.FONT_SIZE_NORMAL}pt;
-            }}
-        """)
+        self.terminal.setMaximumBlockCount(_TERMINAL_MAX_LINES)
+        self.terminal.setStyleSheet(_TERMINAL_QSS)
         layout.addWidget(self.terminal)
         
     def start_scan(self):
         """Start security scan."""
         logger.info("Starting cloud security scan...")
+        self._ensure_ui()
         self.scan_btn.setEnabled(False)
         self.terminal.clear()
         self.progress_bar.setValue(0)
@@ -214,26 +382,60 @@ class ScanPage(QWidget):
         if self.credentials_callback:
             credentials = self.credentials_callback()
         
-        self.worker = ScanWorker(credentials)
-        self.worker.log_signal.connect(self.append_log)
-        self.worker.progress_signal.connect(self.update_progress)
-        self.worker.finished_signal.connect(self.on_scan_complete)
-        self.worker.start()
+        # Point at the fix while no provider is configured
+        if any(_has(credentials, provider, key) for provider, key, _, _ in _PROVIDERS):
+            self.scan_btn.setToolTip("")
+        else:
+            self.scan_btn.setToolTip("No cloud credentials configured. Add them on the Credentials page.")
+        
+        # The worker is rerun with this scan's credentials, unless the last
+        # scan's run() has not returned yet; that one gets a fresh worker
+        if self.worker.is_running():
+            self.worker = self._create_worker()
+        self.worker.reset(credentials)
+        self.cancel_btn.setEnabled(True)
+        self._pending_progress = None
+        self._progress_timer.start()
+        QThreadPool.globalInstance().start(self.worker)
+        
+    def cancel_scan(self):
+        """Stop the running scan at its next stage boundary."""
+        self.cancel_btn.setEnabled(False)
+        self.progress_label.setText("Cancelling scan...")
+        self.worker.cancel()
         
     def append_log(self, message: str):
-        """Append message to terminal output."""
-        self.terminal.append(message)
+        """Append a block of one or more log lines to terminal output."""
+        self.terminal.appendPlainText(message)
         self.terminal.moveCursor(QTextCursor.End)
     
     def update_progress(self, value: int, step: str):
-        """Update progress bar and label."""
+        """Record a progress update; the progress timer applies the latest one."""
+        self._pending_progress = (value, step)
+    
+    def _flush_progress(self):
+        """Show the most recent progress update, dropping any it superseded."""
+        if self._pending_progress is None:
+            return
+        value, step = self._pending_progress
+        self._pending_progress = None
         self.progress_bar.setValue(value)
         self.progress_label.setText(f"{step}... ({value}%)")
         
     def on_scan_complete(self, result: dict):
         """Handle scan completion."""
+        self._progress_timer.stop()
+        self._flush_progress()
         self.scan_btn.setEnabled(True)
+        self.cancel_btn.setEnabled(False)
+        
+        # A cancelled scan has no result worth reporting
+        if result.get("cancelled"):
+            self.progress_label.setText("Scan cancelled")
+            logger.info("Scan cancelled")
+            return
+        
         self.progress_label.setText("Scan complete!")
         self.scan_completed.emit(result)
-        findings_count = len(result.get('findings', []))
+        findings_count = len(result.get('findings') or ())
         logger.info(f"Scan completed with {findings_count} findings")